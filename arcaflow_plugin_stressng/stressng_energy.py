@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+import glob
+import os
+import time
+import typing
+
+from stressng_schema import CommonOutput, EnergyOutput
+
+
+def read_int(path: str) -> typing.Optional[int]:
+    try:
+        with open(path, "r") as value:
+            return int(value.read().strip())
+    except (EnvironmentError, ValueError):
+        return None
+
+
+def read_str(path: str) -> typing.Optional[str]:
+    try:
+        with open(path, "r") as value:
+            return value.read().strip()
+    except EnvironmentError:
+        return None
+
+
+class RaplZone:
+    """
+    An energy counter of the powercap RAPL interface, accumulating the
+    consumed energy across counter wraparounds
+    """
+
+    def __init__(self, path: str, domain: str):
+        self.path = path
+        self.domain = domain
+        self.max_range = read_int(os.path.join(path, "max_energy_range_uj"))
+        self.last = None
+        self.consumed = 0
+
+    def read(self) -> typing.Optional[int]:
+        return read_int(os.path.join(self.path, "energy_uj"))
+
+    def sample(self):
+        current = self.read()
+        if current is None:
+            return
+        if self.last is not None:
+            if current >= self.last:
+                self.consumed += current - self.last
+            elif self.max_range is not None:
+                self.consumed += current + self.max_range - self.last
+        self.last = current
+
+
+class EnergyMonitor:
+    """
+    Samples the RAPL package and DRAM energy counters and the hwmon and
+    thermal zone temperatures below a sysfs root while stress-ng runs
+    """
+
+    def __init__(self, sysfs: str = "/sys"):
+        self.sysfs = sysfs
+        self.zones = self.find_zones()
+        self.temperature_paths = sorted(
+            glob.glob(os.path.join(sysfs, "class/hwmon/hwmon*/temp*_input"))
+            + glob.glob(
+                os.path.join(sysfs, "class/thermal/thermal_zone*/temp")
+            )
+        )
+        self.temperatures = []
+        self.start_time = None
+        self.stop_time = None
+
+    def find_zones(self) -> typing.List[RaplZone]:
+        zones = []
+        for path in sorted(
+            glob.glob(os.path.join(self.sysfs, "class/powercap/intel-rapl:*"))
+        ):
+            name = read_str(os.path.join(path, "name"))
+            if name is None:
+                continue
+            if name.startswith("package"):
+                zones.append(RaplZone(path, "package"))
+            elif name == "dram":
+                zones.append(RaplZone(path, "dram"))
+        return zones
+
+    def sample(self):
+        for zone in self.zones:
+            zone.sample()
+        for path in self.temperature_paths:
+            millidegrees = read_int(path)
+            if millidegrees is not None:
+                self.temperatures.append(millidegrees / 1000)
+
+    def start(self):
+        self.start_time = time.monotonic()
+        self.sample()
+
+    def stop(self) -> EnergyOutput:
+        self.sample()
+        self.stop_time = time.monotonic()
+        return self.output()
+
+    def energy(self, domain: str) -> typing.Optional[float]:
+        """
+        Returns the energy consumed by all zones of a domain in joules, or
+        None when the counters could not be read
+        """
+        zones = [
+            zone
+            for zone in self.zones
+            if zone.domain == domain and zone.last is not None
+        ]
+        if not zones:
+            return None
+        return sum(zone.consumed for zone in zones) / 1e6
+
+    def output(self) -> EnergyOutput:
+        duration = self.stop_time - self.start_time
+        package = self.energy("package")
+        dram = self.energy("dram")
+        output = EnergyOutput(
+            duration=duration,
+            package_energy=package,
+            dram_energy=dram,
+        )
+        if duration > 0:
+            if package is not None:
+                output.package_power = package / duration
+            if dram is not None:
+                output.dram_power = dram / duration
+        if self.temperatures:
+            output.max_temperature = max(self.temperatures)
+            output.average_temperature = sum(self.temperatures) / len(
+                self.temperatures
+            )
+        return output
+
+
+def attribute_energy(outputs: typing.List[CommonOutput], energy: EnergyOutput):
+    """
+    Attributes the package and DRAM energy of the run to the stressors.
+    Stressors run concurrently, so the energy is shared by their user +
+    system time, or evenly when no CPU time was reported.
+    """
+    if energy.package_energy is None or not outputs:
+        return
+    total = energy.package_energy + (energy.dram_energy or 0)
+    cpu_times = [output.user_time + output.system_time for output in outputs]
+    cpu_time = sum(cpu_times)
+    for output, output_cpu_time in zip(outputs, cpu_times):
+        if cpu_time > 0:
+            output.energy = total * output_cpu_time / cpu_time
+        else:
+            output.energy = total / len(outputs)
+        if output.wall_clock_time > 0:
+            output.average_power = output.energy / output.wall_clock_time
+        if output.energy > 0:
+            output.bogo_ops_per_joule = output.bogo_ops / output.energy
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+import csv
+import dataclasses
+import os
+import typing
+
+from stressng_schema import (
+    CommonOutput,
+    ExportFormat,
+    SystemInfoOutput,
+    WorkloadResults,
+)
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+scalar_types = (bool, int, float, str)
+
+
+def columns(cls) -> typing.List[typing.Tuple[str, type]]:
+    """
+    Returns the name and type of the scalar fields of a dataclass, optional
+    fields are reported with their underlying type
+    """
+    hints = typing.get_type_hints(cls)
+    result = []
+    for item in dataclasses.fields(cls):
+        field_type = hints[item.name]
+        if typing.get_origin(field_type) is typing.Union:
+            args = [
+                arg
+                for arg in typing.get_args(field_type)
+                if arg is not type(None)
+            ]
+            if len(args) != 1:
+                continue
+            field_type = args[0]
+        if field_type in scalar_types:
+            result.append((item.name, field_type))
+    return result
+
+
+def stressor_outputs(results: WorkloadResults) -> typing.List[CommonOutput]:
+    outputs = []
+    for item in dataclasses.fields(results):
+        value = getattr(results, item.name)
+        if isinstance(value, CommonOutput):
+            outputs.append(value)
+    return outputs
+
+
+def flatten(
+    results: WorkloadResults,
+) -> typing.Dict[
+    str, typing.Tuple[typing.List[typing.Tuple[str, type]], typing.List[dict]]
+]:
+    """
+    Flattens the results into tables of typed columns and rows, keyed by
+    table name. Every stressor row carries the hostname and epoch of the run
+    so the tables can be joined.
+    """
+    system_columns = columns(SystemInfoOutput)
+    system_row = {
+        name: getattr(results.systeminfo, name) for name, _ in system_columns
+    }
+
+    metrics_columns = [("hostname", str), ("epoch", int)]
+    metrics_rows = []
+    for output in stressor_outputs(results):
+        row = {
+            "hostname": results.systeminfo.hostname,
+            "epoch": results.systeminfo.epoch,
+        }
+        for name, column_type in columns(type(output)):
+            if (name, column_type) not in metrics_columns:
+                metrics_columns.append((name, column_type))
+            row[name] = getattr(output, name)
+        metrics_rows.append(row)
+
+    return {
+        "systeminfo": (system_columns, [system_row]),
+        "metrics": (metrics_columns, metrics_rows),
+    }
+
+
+def arrow_type(column_type: type):
+    return {
+        bool: pyarrow.bool_(),
+        int: pyarrow.int64(),
+        float: pyarrow.float64(),
+        str: pyarrow.string(),
+    }[column_type]
+
+
+def write_csv(path: str, column_list, rows):
+    with open(path, "w", newline="") as output:
+        writer = csv.DictWriter(
+            output, fieldnames=[name for name, _ in column_list]
+        )
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+def write_arrow(path: str, column_list, rows, export_format: ExportFormat):
+    table = pyarrow.table(
+        {
+            name: pyarrow.array(
+                [row.get(name) for row in rows], type=arrow_type(column_type)
+            )
+            for name, column_type in column_list
+        }
+    )
+    if export_format == ExportFormat.PARQUET:
+        pyarrow.parquet.write_table(table, path)
+    else:
+        with pyarrow.ipc.new_file(path, table.schema) as writer:
+            writer.write_table(table)
+
+
+def export_results(
+    results: WorkloadResults, path: str, export_format: ExportFormat
+) -> typing.List[str]:
+    """
+    Writes one file per table into the given directory and returns the
+    paths of the written files. Parquet and Arrow IPC need pyarrow, without
+    it the tables are written as CSV.
+    """
+    if export_format != ExportFormat.CSV and pyarrow is None:
+        print("==>> pyarrow is not installed, exporting as CSV instead...")
+        export_format = ExportFormat.CSV
+
+    os.makedirs(path, exist_ok=True)
+    written = []
+    for table, (column_list, rows) in flatten(results).items():
+        filename = os.path.join(
+            path,
+            "{}-{}-{}.{}".format(
+                table,
+                results.systeminfo.hostname,
+                results.systeminfo.epoch,
+                export_format.value,
+            ),
+        )
+        if export_format == ExportFormat.CSV:
+            write_csv(filename, column_list, rows)
+        else:
+            write_arrow(filename, column_list, rows, export_format)
+        written.append(filename)
+    return written
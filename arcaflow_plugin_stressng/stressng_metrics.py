@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+
+import http.server
+import os
+import tempfile
+import threading
+import typing
+
+from stressng_schema import Stressors, WorkloadResults
+from stressng_export import stressor_outputs
+
+
+content_type = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+def escape_label(value: str) -> str:
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+def stressor_workers(jobfile: str) -> typing.Dict[str, int]:
+    """
+    Returns the number of workers requested per stressor in a jobfile
+    """
+    names = [stressor.value for stressor in Stressors]
+    workers = {}
+    for line in jobfile.splitlines():
+        words = line.split()
+        if len(words) == 2 and words[0] in names:
+            try:
+                workers[words[0]] = int(words[1])
+            except ValueError:
+                pass
+    return workers
+
+
+def read_meminfo(path: str = "/proc/meminfo") -> typing.Dict[str, int]:
+    """
+    Returns the /proc/meminfo entries in bytes
+    """
+    meminfo = {}
+    with open(path, "r") as info:
+        for line in info:
+            key, _, value = line.partition(":")
+            words = value.split()
+            if not words:
+                continue
+            amount = int(words[0])
+            if len(words) > 1 and words[1] == "kB":
+                amount = amount * 1024
+            meminfo[key.strip()] = amount
+    return meminfo
+
+
+class MetricsExporter:
+    """
+    Holds gauges for a stress-ng run and exposes them in the OpenMetrics
+    text format, either through a node_exporter textfile or a local HTTP
+    endpoint
+    """
+
+    def __init__(
+        self,
+        textfile: typing.Optional[str] = None,
+        port: typing.Optional[int] = None,
+        address: str = "127.0.0.1",
+    ):
+        self.textfile = textfile
+        self.port = port
+        self.address = address
+        self.server = None
+        self.thread = None
+        self.lock = threading.Lock()
+        self.gauges = {}
+
+    def set(
+        self,
+        name: str,
+        value: float,
+        description: str,
+        labels: typing.Optional[typing.Dict[str, str]] = None,
+    ):
+        label_set = tuple(sorted((labels or {}).items()))
+        with self.lock:
+            gauge = self.gauges.setdefault(
+                name, {"description": description, "samples": {}}
+            )
+            gauge["samples"][label_set] = value
+
+    def render(self) -> str:
+        lines = []
+        with self.lock:
+            for name, gauge in self.gauges.items():
+                lines.append("# TYPE {} gauge".format(name))
+                lines.append("# HELP {} {}".format(name, gauge["description"]))
+                for label_set, value in gauge["samples"].items():
+                    labels = ""
+                    if label_set:
+                        labels = "{{{}}}".format(
+                            ",".join(
+                                '{}="{}"'.format(key, escape_label(label))
+                                for key, label in label_set
+                            )
+                        )
+                    lines.append("{}{} {}".format(name, labels, value))
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self):
+        """
+        Replaces the textfile atomically so node_exporter never reads a
+        partially written file
+        """
+        directory = os.path.dirname(os.path.abspath(self.textfile))
+        fd, path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as output:
+                output.write(self.render())
+            os.chmod(path, 0o644)
+            os.replace(path, self.textfile)
+        except EnvironmentError:
+            os.remove(path)
+            raise
+
+    def start(self):
+        if self.textfile is not None:
+            # fail before stress-ng starts rather than on the first update
+            directory = os.path.dirname(os.path.abspath(self.textfile))
+            if not os.path.isdir(directory) or not os.access(
+                directory, os.W_OK
+            ):
+                raise OSError(
+                    "textfile directory {} is not writable".format(directory)
+                )
+        if self.port is None:
+            return
+        exporter = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(
+            (self.address, self.port), Handler
+        )
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.thread.join()
+            self.server = None
+
+    def publish(self):
+        if self.textfile is not None:
+            self.write_textfile()
+
+    def update_run(self, jobfile: str, elapsed: float, running: bool):
+        self.set(
+            "stressng_running",
+            1 if running else 0,
+            "Whether stress-ng is currently running",
+        )
+        self.set(
+            "stressng_elapsed_seconds",
+            elapsed,
+            "Seconds elapsed since stress-ng was started",
+        )
+        for stressor, workers in stressor_workers(jobfile).items():
+            self.set(
+                "stressng_stressor_workers",
+                workers,
+                "Number of workers requested per stressor (0 means one per "
+                "CPU)",
+                {"stressor": stressor},
+            )
+        self.update_host()
+        self.publish()
+
+    def update_host(self):
+        load = os.getloadavg()
+        for index, period in enumerate(["1m", "5m", "15m"]):
+            self.set(
+                "stressng_host_load_average",
+                load[index],
+                "Host load average",
+                {"period": period},
+            )
+        try:
+            meminfo = read_meminfo()
+        except EnvironmentError:
+            return
+        if "MemAvailable" in meminfo:
+            self.set(
+                "stressng_host_memory_available_bytes",
+                meminfo["MemAvailable"],
+                "Memory available on the host",
+            )
+
+    def update_results(self, results: WorkloadResults):
+        for output in stressor_outputs(results):
+            labels = {"stressor": output.stressor}
+            self.set(
+                "stressng_bogo_ops",
+                output.bogo_ops,
+                "Number of stressor loop iterations",
+                labels,
+            )
+            self.set(
+                "stressng_bogo_ops_per_second_real_time",
+                output.bogo_ops_per_second_real_time,
+                "Bogo operations per second of wall clock time",
+                labels,
+            )
+            self.set(
+                "stressng_bogo_ops_per_second_usr_sys_time",
+                output.bogo_ops_per_second_usr_sys_time,
+                "Bogo operations per second of user and system time",
+                labels,
+            )
+            self.set(
+                "stressng_wall_clock_seconds",
+                output.wall_clock_time,
+                "Time the stressor took to run",
+                labels,
+            )
+        self.publish()
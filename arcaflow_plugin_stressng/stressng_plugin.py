@@ -1,24 +1,535 @@
 #!/usr/bin/env python3
 
+import copy
+import re
 import sys
 import typing
 import tempfile
 import yaml
 import subprocess
 import os
+import sqlite3
+import time
 
 from arcaflow_plugin_sdk import plugin
 from stressng_schema import (
+    MatrixStressorParams,
+    Matrix3dStressorParams,
+    MqStressorParams,
+    CyclicStressorParams,
+    Stressors,
+    PipeStressorParams,
+    SemStressorParams,
+    FutexStressorParams,
+    MsgStressorParams,
+    SockStressorParams,
+    StressNGParams,
+    SystemInfoOutput,
     WorkloadParams,
     WorkloadResults,
     WorkloadError,
+    MiscMetricOutput,
+    LatencyPercentileOutput,
+    LatencyBucketOutput,
     system_info_output_schema,
     cpu_output_schema,
     vm_output_schema,
     matrix_output_schema,
+    matrix_3d_output_schema,
     mq_output_schema,
+    pipe_output_schema,
+    sem_output_schema,
+    futex_output_schema,
+    msg_output_schema,
+    sock_output_schema,
     hdd_output_schema,
+    iomix_output_schema,
+    aio_output_schema,
+    aiol_output_schema,
+    readahead_output_schema,
+    stream_output_schema,
+    memcpy_output_schema,
+    cache_output_schema,
+    l1cache_output_schema,
+    cyclic_output_schema,
 )
+from stressng_store import ResultsStore, ResultCache, cache_key
+from stressng_export import export_results
+from stressng_metrics import MetricsExporter
+from stressng_preflight import preflight
+from stressng_energy import EnergyMonitor, attribute_energy
+from stressng_profile import Profiler, runtime_phase
+
+
+stressng_binary = "/usr/bin/stress-ng"
+
+# maps the stressor names in the stress-ng metrics to the WorkloadResults
+# field and output schema holding their results
+output_schemas = {
+    "cpu": ("cpuinfo", cpu_output_schema),
+    "vm": ("vminfo", vm_output_schema),
+    "matrix": ("matrixinfo", matrix_output_schema),
+    "matrix-3d": ("matrix3dinfo", matrix_3d_output_schema),
+    "mq": ("mqinfo", mq_output_schema),
+    "pipe": ("pipeinfo", pipe_output_schema),
+    "sem": ("seminfo", sem_output_schema),
+    "futex": ("futexinfo", futex_output_schema),
+    "msg": ("msginfo", msg_output_schema),
+    "sock": ("sockinfo", sock_output_schema),
+    "cyclic": ("cyclicinfo", cyclic_output_schema),
+    "hdd": ("hddinfo", hdd_output_schema),
+    "iomix": ("iomixinfo", iomix_output_schema),
+    "aio": ("aioinfo", aio_output_schema),
+    "aiol": ("aiolinfo", aiol_output_schema),
+    "readahead": ("readaheadinfo", readahead_output_schema),
+    "stream": ("streaminfo", stream_output_schema),
+    "memcpy": ("memcpyinfo", memcpy_output_schema),
+    "cache": ("cacheinfo", cache_output_schema),
+    "l1cache": ("l1cacheinfo", l1cache_output_schema),
+}
+
+misc_metric_line = re.compile(
+    r"^stress-ng: \w+:\s+\[\d+\]\s+(?P<stressor>\S+)\s+"
+    r"(?P<value>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s+"
+    r"(?P<description>.+?)"
+    r"(?:\s+\((?:harmonic |geometric |arithmetic )?mean of.*\))?\s*$"
+)
+
+# scale of the latency units stress-ng uses in its metrics to nanoseconds
+latency_units = {
+    "ns": 1,
+    "nsec": 1,
+    "nsecs": 1,
+    "nanosec": 1,
+    "nanosecs": 1,
+    "usec": 1e3,
+    "usecs": 1e3,
+    "microsec": 1e3,
+    "microsecs": 1e3,
+    "msec": 1e6,
+    "msecs": 1e6,
+    "millisec": 1e6,
+    "millisecs": 1e6,
+}
+
+# exit codes stress-ng uses when stressors were skipped for lack of
+# resources or because they are not implemented on the platform, they are
+# only tolerated for jobs with stressors that may be skipped
+skipped_exit_codes = (3, 4)
+
+# stressors stress-ng may skip while the rest of the job still runs, e.g.
+# cyclic without CAP_SYS_NICE
+skippable_stressors = (CyclicStressorParams,)
+
+summary_line = re.compile(
+    r"^stress-ng: \w+:\s+\[\d+\]\s+(skipped|failed): (\d+)(?::(.*))?$"
+)
+
+# IPC stressor parameters and their stressor names, which are also the
+# names of the fields holding the number of workers
+ipc_stressors = {
+    MqStressorParams: "mq",
+    PipeStressorParams: "pipe",
+    SemStressorParams: "sem",
+    FutexStressorParams: "futex",
+    MsgStressorParams: "msg",
+    SockStressorParams: "sock",
+}
+
+cyclic_line = re.compile(r"^stress-ng: \w+:\s+\[\d+\]\s+cyclic:\s*(.*)$")
+cyclic_stats = {
+    "latency_mean": re.compile(r"\bmean:\s*([\d.]+)\s*ns"),
+    "latency_min": re.compile(r"\bmin:\s*([\d.]+)\s*ns"),
+    "latency_max": re.compile(r"\bmax:\s*([\d.]+)\s*ns"),
+    "latency_stddev": re.compile(r"\bstd\.?\s*dev\.?:?\s*([\d.]+)"),
+}
+cyclic_percentile = re.compile(r"^([\d.]+)%:?\s+([\d.]+)\s*ns")
+cyclic_bucket = re.compile(r"^(\d+)\s+(\d+)$")
+
+perf_header_line = re.compile(r"^stress-ng: \w+:\s+\[\d+\]\s+(\S+):\s*$")
+
+perf_counter_line = re.compile(
+    r"^stress-ng: \w+:\s+\[\d+\]\s+(?P<count>\d[\d,]*)\s+"
+    r"(?P<event>\S.*?)\s+[\d.]+\s*\S?/sec.*$"
+)
+
+
+def get_stressng_version() -> str:
+    return subprocess.check_output(
+        [stressng_binary, "--version"],
+        text=True,
+        stderr=subprocess.STDOUT,
+    ).strip()
+
+
+def get_cpu_model(cpuinfo: str = "/proc/cpuinfo") -> str:
+    try:
+        with open(cpuinfo, "r") as info:
+            for line in info:
+                key, _, value = line.partition(":")
+                if key.strip() in ("model name", "cpu model", "Processor"):
+                    return value.strip()
+    except EnvironmentError:
+        pass
+    return os.uname().machine
+
+
+def parse_misc_metrics(
+    output: str,
+) -> typing.Dict[str, typing.List[MiscMetricOutput]]:
+    """
+    Parses the miscellaneous metrics section stress-ng prints after the
+    metrics table, e.g.
+    "stress-ng: metrc: [42] hdd 123.45 MB/sec read rate (harmonic mean of 1
+    instance)"
+    """
+    misc = {}
+    in_section = False
+    for line in output.splitlines():
+        if "miscellaneous metrics" in line:
+            in_section = True
+            continue
+        if not in_section:
+            continue
+        match = misc_metric_line.match(line.strip())
+        if match is None:
+            continue
+        misc.setdefault(match.group("stressor"), []).append(
+            MiscMetricOutput(
+                match.group("description"), float(match.group("value"))
+            )
+        )
+    return misc
+
+
+def parse_perf_counters(
+    output: str, perfstats: typing.Optional[typing.List[dict]] = None
+) -> typing.Dict[str, typing.Dict[str, int]]:
+    """
+    Returns the perf event counts per stressor, keyed by the lowercase,
+    dash separated event name (e.g. cache-misses). The perfstats section of
+    the YAML output is used when present, otherwise the counters are
+    parsed from the stress-ng output.
+    """
+    counters = {}
+    if perfstats:
+        for stats in perfstats:
+            stressor = stats.get("stressor")
+            for event, count in stats.items():
+                if event != "stressor" and isinstance(count, (int, float)):
+                    counters.setdefault(stressor, {})[event] = int(count)
+        return counters
+
+    stressor = None
+    for line in output.splitlines():
+        header = perf_header_line.match(line.strip())
+        if header is not None:
+            stressor = header.group(1)
+            continue
+        match = perf_counter_line.match(line.strip())
+        if match is None or stressor is None:
+            continue
+        event = "-".join(match.group("event").lower().split())
+        counters.setdefault(stressor, {})[event] = int(
+            match.group("count").replace(",", "")
+        )
+    return counters
+
+
+def parse_cyclic_latency(output: str) -> typing.Dict[str, typing.Any]:
+    """
+    Parses the wakeup latency statistics, percentiles and distribution the
+    cyclic stressor prints, keyed by CyclicOutput field
+    """
+    latency = {}
+    percentiles = []
+    histogram = []
+    in_distribution = False
+    for line in output.splitlines():
+        match = cyclic_line.match(line.strip())
+        if match is None:
+            continue
+        text = match.group(1).strip()
+        if "distribution" in text:
+            in_distribution = True
+            continue
+        percentile = cyclic_percentile.match(text)
+        if percentile is not None:
+            percentiles.append(
+                LatencyPercentileOutput(
+                    float(percentile.group(1)), float(percentile.group(2))
+                )
+            )
+            continue
+        bucket = cyclic_bucket.match(text)
+        if bucket is not None and in_distribution:
+            histogram.append(
+                LatencyBucketOutput(int(bucket.group(1)), int(bucket.group(2)))
+            )
+            continue
+        for name, pattern in cyclic_stats.items():
+            stat = pattern.search(text)
+            if stat is not None and name not in latency:
+                latency[name] = float(stat.group(1))
+    if percentiles:
+        latency["latency_percentiles"] = percentiles
+    if histogram:
+        latency["latency_histogram"] = histogram
+    return latency
+
+
+def unserialize_metric(
+    output_schema,
+    metric: typing.Dict[str, typing.Any],
+    misc: typing.List[MiscMetricOutput],
+):
+    """
+    Unserializes a stress-ng metric, keys that are not part of the output
+    schema (newer stress-ng versions report miscellaneous metrics in the
+    YAML output) are turned into miscellaneous metrics
+    """
+    known = {}
+    misc = list(misc)
+    for key, value in metric.items():
+        if key in output_schema.properties:
+            known[key] = value
+        elif isinstance(value, (int, float)):
+            misc.append(MiscMetricOutput(key, float(value)))
+    output = output_schema.unserialize(known)
+    if misc:
+        output.misc_metrics = misc
+    return output
+
+
+def metric_tokens(description: str) -> typing.List[str]:
+    return re.split(r"[^a-z0-9.%]+", description.lower())
+
+
+def misc_latency(
+    misc: typing.Optional[typing.List[MiscMetricOutput]],
+) -> typing.Optional[float]:
+    """
+    Returns the first miscellaneous metric expressed in a time unit,
+    converted to nanoseconds
+    """
+    for metric in misc or []:
+        for token in metric_tokens(metric.description):
+            if token in latency_units:
+                return metric.value * latency_units[token]
+    return None
+
+
+def misc_metric(
+    misc: typing.Optional[typing.List[MiscMetricOutput]],
+    words: typing.Tuple[str, ...],
+    exclude: typing.Tuple[str, ...] = (),
+) -> typing.Optional[float]:
+    """
+    Returns the value of the first miscellaneous metric whose description
+    contains all of the given words and none of the excluded ones
+    """
+    for metric in misc or []:
+        tokens = metric_tokens(metric.description)
+        if all(word in tokens for word in words) and not any(
+            word in tokens for word in exclude
+        ):
+            return metric.value
+    return None
+
+
+def resolve_workers(workers: int, system_info: SystemInfoOutput) -> int:
+    # 0 workers means one worker per online CPU
+    if workers <= 0:
+        return system_info.cpus_online
+    return workers
+
+
+def derive_matrix_results(
+    matrixinfo,
+    workers: int,
+    size: typing.Optional[int],
+    dimensions: int,
+    system_info: SystemInfoOutput,
+):
+    workers = resolve_workers(workers, system_info)
+    matrixinfo.workers = workers
+    matrixinfo.ops_per_second_per_worker = (
+        matrixinfo.bogo_ops_per_second_real_time / workers
+    )
+    if size is not None:
+        matrixinfo.element_ops_per_second_per_worker = (
+            matrixinfo.ops_per_second_per_worker * size**dimensions
+        )
+
+
+def derive_ipc_results(ipcinfo, workers: int, system_info: SystemInfoOutput):
+    ipcinfo.workers = resolve_workers(workers, system_info)
+    if ipcinfo.bogo_ops_per_second_real_time > 0:
+        ipcinfo.mean_op_latency = (
+            ipcinfo.workers / ipcinfo.bogo_ops_per_second_real_time * 1e9
+        )
+
+
+def derive_results(
+    outputs: typing.Dict[str, typing.Any],
+    perf: typing.Dict[str, typing.Dict[str, int]],
+    stressors: typing.List[typing.Any],
+    system_info: SystemInfoOutput,
+):
+    """
+    Fills in the stressor specific results derived from the stressor
+    parameters, miscellaneous metrics and perf counters, outputs is keyed by
+    WorkloadResults field
+    """
+    for item in stressors:
+        if isinstance(item, MatrixStressorParams) and "matrixinfo" in outputs:
+            derive_matrix_results(
+                outputs["matrixinfo"],
+                item.matrix,
+                item.matrix_size,
+                2,
+                system_info,
+            )
+        if (
+            isinstance(item, Matrix3dStressorParams)
+            and "matrix3dinfo" in outputs
+        ):
+            derive_matrix_results(
+                outputs["matrix3dinfo"],
+                item.matrix_3d,
+                item.matrix_3d_size,
+                3,
+                system_info,
+            )
+        for cls, name in ipc_stressors.items():
+            if isinstance(item, cls) and name + "info" in outputs:
+                derive_ipc_results(
+                    outputs[name + "info"], getattr(item, name), system_info
+                )
+
+    for name in ipc_stressors.values():
+        ipcinfo = outputs.get(name + "info")
+        if ipcinfo is None:
+            continue
+        ipcinfo.reported_latency = misc_latency(ipcinfo.misc_metrics)
+        ipcinfo.throughput = misc_metric(ipcinfo.misc_metrics, ("mb",))
+
+    hddinfo = outputs.get("hddinfo")
+    if hddinfo is not None:
+        hddinfo.read_rate = misc_metric(
+            hddinfo.misc_metrics, ("mb", "read"), ("write",)
+        )
+        hddinfo.write_rate = misc_metric(
+            hddinfo.misc_metrics, ("mb", "write"), ("read",)
+        )
+
+    streaminfo = outputs.get("streaminfo")
+    if streaminfo is not None:
+        streaminfo.read_rate = misc_metric(
+            streaminfo.misc_metrics, ("mb", "read")
+        )
+        streaminfo.write_rate = misc_metric(
+            streaminfo.misc_metrics, ("mb", "write")
+        )
+        streaminfo.mflops = misc_metric(streaminfo.misc_metrics, ("mflop",))
+
+    memcpyinfo = outputs.get("memcpyinfo")
+    if memcpyinfo is not None:
+        memcpyinfo.copy_rate = misc_metric(memcpyinfo.misc_metrics, ("mb",))
+
+    for name in ("cache", "l1cache"):
+        cacheinfo = outputs.get(name + "info")
+        if cacheinfo is None or name not in perf:
+            continue
+        cacheinfo.cache_references = perf[name].get("cache-references")
+        cacheinfo.cache_misses = perf[name].get("cache-misses")
+        if cacheinfo.cache_references and cacheinfo.cache_misses is not None:
+            cacheinfo.cache_miss_ratio = (
+                cacheinfo.cache_misses / cacheinfo.cache_references
+            )
+
+
+def run_stressng(
+    command: typing.List[str],
+    workdir: str,
+    on_tick: typing.Optional[typing.Callable[[], None]] = None,
+    interval: float = 1.0,
+    profiler: typing.Optional[Profiler] = None,
+    allow_skipped: bool = False,
+) -> str:
+    """
+    Runs stress-ng and returns its output, calling on_tick every interval
+    seconds while it is running. With allow_skipped the exit codes for
+    skipped stressors are not treated as failures.
+    """
+    if profiler is None:
+        profiler = Profiler()
+    with profiler.span("spawn"):
+        process = subprocess.Popen(
+            command,
+            cwd=workdir,
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+    try:
+        with profiler.span(runtime_phase):
+            while True:
+                try:
+                    output, _ = process.communicate(timeout=interval)
+                    break
+                except subprocess.TimeoutExpired:
+                    if on_tick is not None:
+                        on_tick()
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    if allow_skipped and process.returncode in skipped_exit_codes:
+        print("==>> stress-ng skipped some stressors, see its output...")
+    elif process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode, command, output
+        )
+    return output
+
+
+def find_skipped(
+    stressors: typing.List[typing.Any],
+    metrics: typing.List[typing.Dict[str, typing.Any]],
+    output: str,
+) -> typing.List[str]:
+    """
+    Returns the names of the stressors stress-ng skipped, raising a
+    ValueError when stress-ng skipped a stressor that may not be skipped,
+    left one out of the metrics or reported failed stressors
+    """
+    reported = {metric["stressor"] for metric in metrics}
+    skippable = [
+        Stressors(item.stressor).value
+        for item in stressors
+        if isinstance(item, skippable_stressors)
+    ]
+    skipped = []
+    for line in output.splitlines():
+        match = summary_line.match(line)
+        if match is None or int(match.group(2)) == 0:
+            continue
+        if match.group(1) == "failed":
+            raise ValueError(
+                "stress-ng reported failed stressors:{}".format(
+                    match.group(3) or " " + match.group(2)
+                )
+            )
+        skipped.extend(re.findall(r"([\w-]+) \(\d+\)", match.group(3) or ""))
+    for item in stressors:
+        name = Stressors(item.stressor).value
+        if name not in reported and name not in skipped:
+            skipped.append(name)
+    for name in skipped:
+        if name not in skippable:
+            raise ValueError(f"stress-ng skipped the {name} stressor")
+    return skipped
 
 
 @plugin.step(
@@ -30,113 +541,380 @@ from stressng_schema import (
 def stressng_run(
     params: WorkloadParams,
 ) -> typing.Tuple[str, typing.Union[WorkloadResults, WorkloadError]]:
+    profiler = Profiler(params.profile)
+    profiler.start()
+    try:
+        return run_workload(params, profiler)
+    finally:
+        profiler.stop()
 
-    print("==>> Generating temporary jobfile...")
+
+def render_jobfile(
+    stress_params: StressNGParams, stressors: typing.List[typing.Any]
+) -> str:
     # generic parameters are in the StressNGParams class (e.g. the timeout)
-    result = params.StressNGParams.to_jobfile()
+    result = stress_params.to_jobfile()
     # now we need to iterate of the list of stressors
-    for item in params.StressNGParams.stressors:
+    for item in stressors:
         result = result + item.to_jobfile()
+    return result
 
-    stressng_jobfile = tempfile.mkstemp()
-    stressng_outfile = tempfile.mkstemp()
 
-    # write the temporary jobfile
-    try:
-        with open(stressng_jobfile[1], "w") as jobfile:
-            try:
-                jobfile.write(result)
-            except IOError as error:
-                return "error", WorkloadError(
-                    f"{error} while trying to write {stressng_jobfile[1]}"
-                )
-    except EnvironmentError as error:
-        return "error", WorkloadError(
-            f"{error} while trying to open {stressng_jobfile[1]}"
-        )
-
-    stressng_command = [
-        "/usr/bin/stress-ng",
-        "-j",
-        stressng_jobfile[1],
-        "--metrics",
-        "-Y",
-        stressng_outfile[1],
-    ]
-
-    print("==>> Running stress-ng with the temporary jobfile...")
+def run_workload(
+    params: WorkloadParams, profiler: Profiler
+) -> typing.Tuple[str, typing.Union[WorkloadResults, WorkloadError]]:
     workdir = "/tmp"
     if params.StressNGParams.workdir is not None:
         workdir = params.StressNGParams.workdir
+
+    print("==>> Generating temporary jobfile...")
     try:
-        print(
-            subprocess.check_output(
-                stressng_command,
-                cwd=workdir,
-                text=True,
-                stderr=subprocess.STDOUT,
+        with profiler.span("jobfile"):
+            # the requested jobfile identifies the run in the cache, even
+            # when the preflight check scales the sizes down
+            requested = render_jobfile(
+                params.StressNGParams, params.StressNGParams.stressors
+            )
+    except ValueError as error:
+        return "error", WorkloadError(f"Invalid stressor parameters: {error}")
+    result = requested
+
+    key = None
+    cached_results = None
+    if params.cache is not None:
+        try:
+            stressng_version = get_stressng_version()
+        except (subprocess.CalledProcessError, OSError) as error:
+            return "error", WorkloadError(
+                f"{error} while trying to get the stress-ng version"
             )
+        key = cache_key(
+            requested,
+            workdir,
+            stressng_version,
+            os.uname().release,
+            get_cpu_model(),
+            params.preflight,
+            params.energy,
         )
-    except subprocess.CalledProcessError as error:
-        return "error", WorkloadError(
-            f"""{error.cmd[0]} failed with return code
-                {error.returncode}:\n{error.output}"""
+        try:
+            with profiler.span("cache-lookup"):
+                cache = ResultCache(
+                    params.cache.path,
+                    params.cache.ttl,
+                    params.cache.max_entries,
+                )
+                try:
+                    cached_results = cache.get(key)
+                finally:
+                    cache.close()
+        except sqlite3.Error as error:
+            return "error", WorkloadError(
+                f"{error} while trying to read the cache {params.cache.path}"
+            )
+
+    preflight_un = None
+    if params.preflight is not None and cached_results is None:
+        print("==>> Running preflight checks...")
+        # the sizes are scaled on a copy that is only used for the jobfile
+        # that gets run
+        stressors = copy.deepcopy(params.StressNGParams.stressors)
+        try:
+            with profiler.span("preflight"):
+                preflight_un = preflight(stressors, workdir, params.preflight)
+        except ValueError as error:
+            return "error", WorkloadError(f"Preflight check failed: {error}")
+        except (EnvironmentError, KeyError) as error:
+            return "error", WorkloadError(
+                f"{error} while running the preflight checks"
+            )
+        with profiler.span("jobfile"):
+            result = render_jobfile(params.StressNGParams, stressors)
+
+    exporter = None
+    if params.metrics is not None:
+        exporter = MetricsExporter(
+            params.metrics.textfile,
+            params.metrics.port,
+            params.metrics.address,
         )
+        try:
+            exporter.start()
+        except OSError as error:
+            return "error", WorkloadError(
+                f"{error} while trying to start the metrics exporter"
+            )
 
+    start_time = time.monotonic()
+    published = False
     try:
-        with open(stressng_outfile[1], "r") as output:
+        if cached_results is not None:
+            print("==>> Returning cached results...")
+            workload_results = cached_results
+        else:
+            status, workload_results = execute_jobfile(
+                params, profiler, result, workdir, exporter, start_time
+            )
+            if status != "success":
+                return status, workload_results
+            workload_results.preflight = preflight_un
+
+        # cached results are published like fresh ones so that the
+        # dashboards and exports are populated either way
+        if exporter is not None:
             try:
-                stressng_yaml = yaml.safe_load(output)
-            except yaml.YAMLError as error:
-                print(error)
+                exporter.update_run(
+                    result, time.monotonic() - start_time, False
+                )
+                exporter.update_results(workload_results)
+                published = True
+            except EnvironmentError as error:
                 return "error", WorkloadError(
-                    f"""{error} in
-                                                  {stressng_outfile[1]}"""
+                    f"{error} while trying to write {params.metrics.textfile}"
                 )
-    except EnvironmentError as error:
-        return "error", WorkloadError(
-            f"{error} while trying to open {stressng_outfile[1]}"
+    finally:
+        if exporter is not None:
+            if not published:
+                # don't leave stressng_running at 1 when the run failed
+                try:
+                    exporter.update_run(
+                        result, time.monotonic() - start_time, False
+                    )
+                except EnvironmentError:
+                    pass
+            exporter.stop()
+
+    # cache hits are already archived from the run that filled the cache,
+    # partial runs are neither archived nor cached
+    complete = cached_results is None and not workload_results.skipped
+    if params.results_store is not None and complete:
+        print("==>> Archiving results in {}...".format(params.results_store))
+        try:
+            with profiler.span("store"):
+                store = ResultsStore(params.results_store)
+                try:
+                    store.add(requested, workload_results, workdir, result)
+                finally:
+                    store.close()
+        except sqlite3.Error as error:
+            return "error", WorkloadError(
+                f"{error} while trying to archive results in "
+                f"{params.results_store}"
+            )
+
+    if params.export is not None:
+        print("==>> Exporting results to {}...".format(params.export.path))
+        try:
+            with profiler.span("export"):
+                export_results(
+                    workload_results, params.export.path, params.export.format
+                )
+        except EnvironmentError as error:
+            return "error", WorkloadError(
+                f"{error} while trying to export results to "
+                f"{params.export.path}"
+            )
+
+    if key is not None and complete:
+        print("==>> Caching results in {}...".format(params.cache.path))
+        try:
+            with profiler.span("cache-store"):
+                cache = ResultCache(
+                    params.cache.path,
+                    params.cache.ttl,
+                    params.cache.max_entries,
+                )
+                try:
+                    cache.put(key, workload_results)
+                finally:
+                    cache.close()
+        except sqlite3.Error as error:
+            return "error", WorkloadError(
+                f"{error} while trying to update the cache {params.cache.path}"
+            )
+
+    workload_results.profile = profiler.output()
+    return "success", workload_results
+
+
+def execute_jobfile(
+    params: WorkloadParams,
+    profiler: Profiler,
+    result: str,
+    workdir: str,
+    exporter: typing.Optional[MetricsExporter],
+    start_time: float,
+) -> typing.Tuple[str, typing.Union[WorkloadResults, WorkloadError]]:
+    """
+    Runs stress-ng with the given jobfile and collects its results
+    """
+    with profiler.span("tempfiles"):
+        stressng_jobfile = tempfile.mkstemp()
+        stressng_outfile = tempfile.mkstemp()
+
+    try:
+        # write the temporary jobfile
+        try:
+            with profiler.span("tempfiles"), open(
+                stressng_jobfile[1], "w"
+            ) as jobfile:
+                try:
+                    jobfile.write(result)
+                except IOError as error:
+                    return "error", WorkloadError(
+                        f"{error} while trying to write {stressng_jobfile[1]}"
+                    )
+        except EnvironmentError as error:
+            return "error", WorkloadError(
+                f"{error} while trying to open {stressng_jobfile[1]}"
+            )
+
+        stressng_command = [
+            stressng_binary,
+            "-j",
+            stressng_jobfile[1],
+            "--metrics",
+            "-Y",
+            stressng_outfile[1],
+        ]
+
+        print("==>> Running stress-ng with the temporary jobfile...")
+
+        interval = 1.0
+        if params.metrics is not None:
+            interval = params.metrics.interval
+
+        monitor = None
+        energy_un = None
+        if params.energy is not None:
+            monitor = EnergyMonitor(params.energy.sysfs)
+            if exporter is None:
+                interval = params.energy.interval
+            else:
+                interval = min(interval, params.energy.interval)
+
+        publish_errors = []
+        allow_skipped = any(
+            isinstance(item, skippable_stressors)
+            for item in params.StressNGParams.stressors
         )
 
-    system_info = stressng_yaml["system-info"]
-    metrics = stressng_yaml["metrics"]
-
-    # allocate all stressor information with None in case they don't get called
-    cpuinfo_un = None
-    vminfo_un = None
-    matrixinfo_un = None
-    mqinfo_un = None
-    hddinfo_un = None
-
-    system_un = system_info_output_schema.unserialize(system_info)
-    for metric in metrics:
-        if metric["stressor"] == "cpu":
-            cpuinfo_un = cpu_output_schema.unserialize(metric)
-        if metric["stressor"] == "vm":
-            vminfo_un = vm_output_schema.unserialize(metric)
-        if metric["stressor"] == "matrix":
-            matrixinfo_un = matrix_output_schema.unserialize(metric)
-        if metric["stressor"] == "mq":
-            mqinfo_un = mq_output_schema.unserialize(metric)
-        if metric["stressor"] == "hdd":
-            hddinfo_un = hdd_output_schema.unserialize(metric)
-
-    print("==>> Workload run complete!")
-    os.close(stressng_jobfile[0])
-    os.close(stressng_outfile[0])
-
-    if params.cleanup:
-        print("==>> Cleaning up operation files...")
-        os.remove(stressng_jobfile[1])
-
-    return "success", WorkloadResults(
-        system_un,
-        vminfo_un,
-        cpuinfo_un,
-        matrixinfo_un,
-        mqinfo_un,
-        hddinfo_un,
-    )
+        def on_tick():
+            if exporter is not None and not publish_errors:
+                # a failing metrics sink must not kill stress-ng, the error
+                # is reported once it finished
+                try:
+                    exporter.update_run(
+                        result, time.monotonic() - start_time, True
+                    )
+                except EnvironmentError as error:
+                    publish_errors.append(error)
+            if monitor is not None:
+                monitor.sample()
+
+        try:
+            if monitor is not None:
+                monitor.start()
+            on_tick()
+            stressng_output = run_stressng(
+                stressng_command,
+                workdir,
+                on_tick,
+                interval,
+                profiler,
+                allow_skipped,
+            )
+            if monitor is not None:
+                energy_un = monitor.stop()
+            print(stressng_output)
+        except subprocess.CalledProcessError as error:
+            return "error", WorkloadError(
+                f"""{error.cmd[0]} failed with return code
+                    {error.returncode}:\n{error.output}"""
+            )
+        except EnvironmentError as error:
+            return "error", WorkloadError(
+                f"{error} while trying to run {stressng_command[0]}"
+            )
+
+        if publish_errors:
+            return "error", WorkloadError(
+                f"{publish_errors[0]} while trying to write "
+                f"{params.metrics.textfile}"
+            )
+
+        try:
+            with profiler.span("yaml-parse"), open(
+                stressng_outfile[1], "r"
+            ) as output:
+                try:
+                    stressng_yaml = yaml.safe_load(output)
+                except yaml.YAMLError as error:
+                    print(error)
+                    return "error", WorkloadError(
+                        f"""{error} in
+                                                      {stressng_outfile[1]}"""
+                    )
+        except EnvironmentError as error:
+            return "error", WorkloadError(
+                f"{error} while trying to open {stressng_outfile[1]}"
+            )
+
+        system_info = stressng_yaml["system-info"]
+        # all stressors may have been skipped
+        metrics = stressng_yaml.get("metrics") or []
+
+        skipped = None
+        if allow_skipped:
+            try:
+                skipped = find_skipped(
+                    params.StressNGParams.stressors, metrics, stressng_output
+                )
+            except ValueError as error:
+                return "error", WorkloadError(f"{error}:\n{stressng_output}")
+
+        # stressors that don't get called are left as None in the results
+        outputs = {}
+        with profiler.span("unserialize"):
+            misc = parse_misc_metrics(stressng_output)
+            perf = parse_perf_counters(
+                stressng_output, stressng_yaml.get("perfstats")
+            )
+
+            system_un = system_info_output_schema.unserialize(system_info)
+            for metric in metrics:
+                if metric["stressor"] in output_schemas:
+                    name, output_schema = output_schemas[metric["stressor"]]
+                    outputs[name] = unserialize_metric(
+                        output_schema, metric, misc.get(metric["stressor"], [])
+                    )
+
+            derive_results(
+                outputs, perf, params.StressNGParams.stressors, system_un
+            )
+
+            if "cyclicinfo" in outputs:
+                for name, value in parse_cyclic_latency(
+                    stressng_output
+                ).items():
+                    setattr(outputs["cyclicinfo"], name, value)
+
+            if energy_un is not None:
+                attribute_energy(list(outputs.values()), energy_un)
+
+        print("==>> Workload run complete!")
+        return "success", WorkloadResults(
+            system_un, energy=energy_un, skipped=skipped or None, **outputs
+        )
+    finally:
+        # the temporary files are closed however the run ended
+        with profiler.span("cleanup"):
+            os.close(stressng_jobfile[0])
+            os.close(stressng_outfile[0])
+
+            if params.cleanup:
+                print("==>> Cleaning up operation files...")
+                os.remove(stressng_jobfile[1])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+import os
+import re
+import typing
+from dataclasses import dataclass
+
+from stressng_schema import (
+    HDDStressorParams,
+    IomixStressorParams,
+    PreflightAction,
+    PreflightOutput,
+    PreflightParams,
+    ReadaheadStressorParams,
+    VmStressorParams,
+)
+from stressng_metrics import read_meminfo
+
+
+size_pattern = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([bkmgt%]?)\s*$", re.I)
+size_units = {
+    "": 1,
+    "b": 1,
+    "k": 1024,
+    "m": 1024**2,
+    "g": 1024**3,
+    "t": 1024**4,
+}
+
+# stressor parameters that allocate memory or disk space, as
+# (parameter class, worker count field, size field, stress-ng default size)
+memory_sizes = [
+    (VmStressorParams, "vm", "vm_bytes", "256m"),
+    (VmStressorParams, "mmap", "mmap_bytes", "256m"),
+]
+disk_sizes = [
+    (HDDStressorParams, "hdd", "hdd_bytes", "1g"),
+    (IomixStressorParams, "iomix", "iomix_bytes", "1g"),
+    (ReadaheadStressorParams, "readahead", "readahead_bytes", "1g"),
+]
+
+
+def parse_size(value: str, total: int) -> int:
+    """
+    Converts a stress-ng size (e.g. 512, 4k, 20g or 50%) to bytes,
+    percentages are relative to total
+    """
+    match = size_pattern.match(str(value))
+    if match is None:
+        raise ValueError("invalid size '{}'".format(value))
+    number = float(match.group(1))
+    unit = match.group(2).lower()
+    if unit == "%":
+        return int(total * number / 100)
+    return int(number * size_units[unit])
+
+
+def online_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+@dataclass
+class Demand:
+    """
+    The amount of memory or disk space a single stressor entry asks for
+    """
+
+    item: typing.Any
+    size_field: str
+    workers: int
+    size: int
+
+    @property
+    def total(self) -> int:
+        return self.workers * self.size
+
+
+def demands(
+    stressors: typing.List[typing.Any], sizes, total: int
+) -> typing.List[Demand]:
+    """
+    Returns the demand of every stressor entry using one of the given sizes.
+    Absolute sizes are counted per worker, which is an upper bound, while
+    percentages are a share of total for all workers of the stressor.
+    """
+    result = []
+    for item in stressors:
+        for cls, count_field, size_field, default in sizes:
+            if not isinstance(item, cls):
+                continue
+            count = getattr(item, count_field)
+            if count is None:
+                continue
+            workers = int(count)
+            if workers <= 0:
+                workers = online_cpus()
+            value = getattr(item, size_field)
+            if value is None:
+                value = default
+            size = parse_size(value, total)
+            if str(value).strip().endswith("%"):
+                size = size // workers
+            result.append(Demand(item, size_field, workers, size))
+    return result
+
+
+def scale(entries: typing.List[Demand], factor: float):
+    for entry in entries:
+        # stress-ng does not accept sizes below 4k
+        size = max(int(entry.size * factor) // 1024, 4)
+        setattr(entry.item, entry.size_field, "{}k".format(size))
+
+
+def preflight(
+    stressors: typing.List[typing.Any],
+    workdir: str,
+    params: PreflightParams,
+    meminfo: str = "/proc/meminfo",
+) -> PreflightOutput:
+    """
+    Compares the memory and disk space the stressors ask for with what is
+    available on the host and in the working directory. Depending on the
+    action it raises a ValueError or scales the sizes of the stressors down
+    in place so they fit within the configured headroom.
+    """
+    memory_available = read_meminfo(meminfo)["MemAvailable"]
+    stat = os.statvfs(workdir)
+    disk_available = stat.f_bavail * stat.f_frsize
+
+    memory = demands(stressors, memory_sizes, memory_available)
+    disk = demands(stressors, disk_sizes, disk_available)
+    output = PreflightOutput(
+        memory_demand=sum(entry.total for entry in memory),
+        memory_available=memory_available,
+        disk_demand=sum(entry.total for entry in disk),
+        disk_available=disk_available,
+    )
+
+    checks = [
+        (
+            "memory",
+            memory,
+            output.memory_demand,
+            memory_available,
+            params.memory_headroom,
+        ),
+        (
+            "disk space",
+            disk,
+            output.disk_demand,
+            disk_available,
+            params.disk_headroom,
+        ),
+    ]
+    for resource, entries, demand, available, headroom in checks:
+        usable = int(available * (1 - headroom / 100))
+        if demand <= usable:
+            continue
+        if PreflightAction(params.action) == PreflightAction.FAIL:
+            raise ValueError(
+                "stressors need {} bytes of {} but only {} bytes are "
+                "usable ({} bytes available, {}% headroom)".format(
+                    demand, resource, usable, available, headroom
+                )
+            )
+        factor = usable / demand
+        scale(entries, factor)
+        if resource == "memory":
+            output.memory_scale = factor
+        else:
+            output.disk_scale = factor
+    return output
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+import contextlib
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+import typing
+
+from stressng_schema import ProfileOutput, ProfileParams, ProfilePhaseOutput
+
+
+# phase spent waiting for stress-ng, everything else is plugin overhead
+runtime_phase = "runtime"
+
+
+class Profiler:
+    """
+    Records the time spent in each phase of a plugin run, optionally with
+    cProfile and tracemalloc. Without parameters every span is a no-op.
+    """
+
+    def __init__(self, params: typing.Optional[ProfileParams] = None):
+        self.params = params
+        self.phases = {}
+        self.start_time = None
+        self.profile = None
+        if params is not None and params.cprofile:
+            self.profile = cProfile.Profile()
+
+    @property
+    def enabled(self) -> bool:
+        return self.params is not None
+
+    def start(self):
+        if not self.enabled:
+            return
+        if self.params.tracemalloc:
+            tracemalloc.start()
+        self.start_time = time.perf_counter()
+
+    @contextlib.contextmanager
+    def span(self, phase: str):
+        """
+        Adds the time spent in the block to the phase, phases entered more
+        than once accumulate their time
+        """
+        if not self.enabled:
+            yield
+            return
+        profiled = self.profile is not None and phase != runtime_phase
+        if profiled:
+            self.profile.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if profiled:
+                self.profile.disable()
+            self.phases[phase] = self.phases.get(phase, 0.0) + duration
+
+    def cprofile_stats(self) -> str:
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+        stats.print_stats(self.params.limit)
+        return stream.getvalue()
+
+    def tracemalloc_stats(self) -> str:
+        snapshot = tracemalloc.take_snapshot()
+        statistics = snapshot.statistics("lineno")[: self.params.limit]
+        return "\n".join(str(statistic) for statistic in statistics)
+
+    def output(self) -> typing.Optional[ProfileOutput]:
+        if not self.enabled:
+            return None
+        total = time.perf_counter() - self.start_time
+        output = ProfileOutput(
+            phases=[
+                ProfilePhaseOutput(phase, duration)
+                for phase, duration in self.phases.items()
+            ],
+            total=total,
+            overhead=total - self.phases.get(runtime_phase, 0.0),
+        )
+        if self.params.tracemalloc and tracemalloc.is_tracing():
+            output.tracemalloc_stats = self.tracemalloc_stats()
+            output.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        if self.profile is not None:
+            output.cprofile_stats = self.cprofile_stats()
+        return output
+
+    def stop(self):
+        """
+        Stops tracing allocations if the run ended before the output was
+        collected
+        """
+        if (
+            self.enabled
+            and self.params.tracemalloc
+            and tracemalloc.is_tracing()
+        ):
+            tracemalloc.stop()
@@ -6,7 +6,7 @@ import dataclasses
 from dataclasses import dataclass, field
 
 from arcaflow_plugin_sdk import plugin, schema
-from arcaflow_plugin_sdk import annotations
+from arcaflow_plugin_sdk import annotations, validation
 
 
 class Stressors(enum.Enum):
@@ -15,6 +15,106 @@ class Stressors(enum.Enum):
     MATRIX = "matrix"
     MQ = "mq"
     HDD = "hdd"
+    IOMIX = "iomix"
+    AIO = "aio"
+    AIOL = "aiol"
+    READAHEAD = "readahead"
+    STREAM = "stream"
+    MEMCPY = "memcpy"
+    CACHE = "cache"
+    L1CACHE = "l1cache"
+    MATRIX_3D = "matrix-3d"
+    PIPE = "pipe"
+    SEM = "sem"
+    FUTEX = "futex"
+    MSG = "msg"
+    SOCK = "sock"
+    CYCLIC = "cyclic"
+
+
+class CyclicPolicy(enum.Enum):
+    DEADLINE = "deadline"
+    FIFO = "fifo"
+    RR = "rr"
+
+
+class CyclicMethod(enum.Enum):
+    CLOCK_NS = "clock_ns"
+    ITIMER = "itimer"
+    POLL = "poll"
+    POSIX_NS = "posix_ns"
+    PSELECT = "pselect"
+    USLEEP = "usleep"
+
+
+class SockDomain(enum.Enum):
+    IPV4 = "ipv4"
+    IPV6 = "ipv6"
+    UNIX = "unix"
+
+
+class SockType(enum.Enum):
+    STREAM = "stream"
+    SEQPACKET = "seqpacket"
+
+
+class SockOpts(enum.Enum):
+    RANDOM = "random"
+    SEND = "send"
+    SENDMSG = "sendmsg"
+    SENDMMSG = "sendmmsg"
+
+
+class Madvise(enum.Enum):
+    DONTNEED = "dontneed"
+    HUGEPAGE = "hugepage"
+    MERGEABLE = "mergeable"
+    NOHUGEPAGE = "nohugepage"
+    NORMAL = "normal"
+    RANDOM = "random"
+    SEQUENTIAL = "sequential"
+    UNMERGEABLE = "unmergeable"
+    WILLNEED = "willneed"
+
+
+class StreamMadvise(enum.Enum):
+    HUGEPAGE = "hugepage"
+    NOHUGEPAGE = "nohugepage"
+    NORMAL = "normal"
+
+
+class HddOpts(enum.Enum):
+    DIRECT = "direct"
+    DSYNC = "dsync"
+    IOVEC = "iovec"
+    NOATIME = "noatime"
+    SYNC = "sync"
+    FSYNC = "fsync"
+    FDATASYNC = "fdatasync"
+    UTIMES = "utimes"
+    FADV_NORMAL = "fadv-normal"
+    FADV_SEQ = "fadv-seq"
+    FADV_RND = "fadv-rnd"
+    FADV_NOREUSE = "fadv-noreuse"
+    FADV_WILLNEED = "fadv-willneed"
+    FADV_DONTNEED = "fadv-dontneed"
+    WR_SEQ = "wr-seq"
+    WR_RND = "wr-rnd"
+    RD_SEQ = "rd-seq"
+    RD_RND = "rd-rnd"
+
+
+# pairs of hdd options that stress-ng rejects when given together
+hdd_opts_conflicts = [
+    (HddOpts.WR_SEQ, HddOpts.WR_RND),
+    (HddOpts.RD_SEQ, HddOpts.RD_RND),
+    (HddOpts.FADV_SEQ, HddOpts.FADV_RND),
+    (HddOpts.FADV_WILLNEED, HddOpts.FADV_DONTNEED),
+] + [
+    (HddOpts.FADV_NORMAL, opt)
+    for opt in HddOpts
+    if opt.value.startswith("fadv-") and opt != HddOpts.FADV_NORMAL
+]
 
 
 @dataclass
@@ -92,6 +192,64 @@ class VmStressorParams(CommonStressorParams):
         default=None, metadata={"name": "Allocation of memory per stressor"}
     )
 
+    vm_method: typing.Optional[str] = field(
+        default=None,
+        metadata={
+            "name": "VM method",
+            "description": (
+                "specify a vm stress method (all, flip, galpat-0, "
+                "modulo-x, prime-incdec, rowhammer, walk-0d etc.), the "
+                "default is all"
+            ),
+        },
+    )
+
+    vm_hang: typing.Optional[int] = field(
+        default=None,
+        metadata={
+            "name": "VM hang",
+            "description": (
+                "sleep N seconds before unmapping memory, 0 means sleep "
+                "until the stressor is terminated"
+            ),
+        },
+    )
+
+    vm_keep: typing.Optional[bool] = field(
+        default=None,
+        metadata={
+            "name": "VM keep",
+            "description": "do not continually unmap and map memory",
+        },
+    )
+
+    vm_populate: typing.Optional[bool] = field(
+        default=None,
+        metadata={
+            "name": "VM populate",
+            "description": "populate (prefault) page tables for the mappings",
+        },
+    )
+
+    vm_locked: typing.Optional[bool] = field(
+        default=None,
+        metadata={
+            "name": "VM locked",
+            "description": "lock the pages of the mapped region into memory",
+        },
+    )
+
+    vm_madvise: typing.Optional[Madvise] = field(
+        default=None,
+        metadata={
+            "name": "VM madvise",
+            "description": (
+                "madvise advice for the vm mappings, use hugepage or "
+                "nohugepage to test the impact of transparent huge pages"
+            ),
+        },
+    )
+
     def to_jobfile(self) -> str:
         vm = "vm {}\n".format(self.vm)
         vm_bytes = "vm-bytes {}\n".format(self.vm_bytes)
@@ -100,473 +258,2327 @@ class VmStressorParams(CommonStressorParams):
             result = result + "mmap {}\n".format(self.mmap)
         if self.mmap_bytes is not None:
             result = result + "mmap-bytes {}\n".format(self.mmap_bytes)
+        if self.vm_method is not None:
+            result = result + "vm-method {}\n".format(self.vm_method)
+        if self.vm_hang is not None:
+            result = result + "vm-hang {}\n".format(self.vm_hang)
+        if self.vm_keep:
+            result = result + "vm-keep\n"
+        if self.vm_populate:
+            result = result + "vm-populate\n"
+        if self.vm_locked:
+            result = result + "vm-locked\n"
+        if self.vm_madvise is not None:
+            result = result + "vm-madvise {}\n".format(
+                Madvise(self.vm_madvise).value
+            )
         return result
 
 
 @dataclass
-class MatrixStressorParams(CommonStressorParams):
-    matrix: int = field(
+class StreamStressorParams(CommonStressorParams):
+    stream: int = field(
         metadata={
-            "name": "Matrix count",
+            "name": "Stream workers",
             "description": (
-                "Number of Matrix stressors to be "
-                "run (0 means 1 stressor per CPU"
+                "start N workers exercising a memory bandwidth stressor "
+                "loosely based on the STREAM benchmark (0 means 1 stressor "
+                "per CPU)"
             ),
         }
     )
 
+    stream_index: typing.Annotated[
+        typing.Optional[int], validation.min(0), validation.max(3)
+    ] = field(
+        default=None,
+        metadata={
+            "name": "Stream index",
+            "description": (
+                "number of stream indices used to randomly access the "
+                "arrays (0 to 3), the default is 0 which disables indexing"
+            ),
+        },
+    )
+
+    stream_l3_size: typing.Optional[str] = field(
+        default=None,
+        metadata={
+            "name": "L3 cache size",
+            "description": (
+                "specify the L3 cache size the arrays are sized from, "
+                "by default this is read from the system"
+            ),
+        },
+    )
+
+    stream_madvise: typing.Optional[StreamMadvise] = field(
+        default=None,
+        metadata={
+            "name": "Stream madvise",
+            "description": (
+                "madvise advice for the stream arrays (hugepage, "
+                "nohugepage or normal)"
+            ),
+        },
+    )
+
     def to_jobfile(self) -> str:
-        matrix = "matrix {}\n".format(self.matrix)
-        result = matrix
+        result = "stream {}\n".format(self.stream)
+        if self.stream_index is not None:
+            result = result + "stream-index {}\n".format(self.stream_index)
+        if self.stream_l3_size is not None:
+            result = result + "stream-l3-size {}\n".format(self.stream_l3_size)
+        if self.stream_madvise is not None:
+            result = result + "stream-madvise {}\n".format(
+                StreamMadvise(self.stream_madvise).value
+            )
         return result
 
 
 @dataclass
-class MqStressorParams(CommonStressorParams):
-    mq: int = field(
+class MemcpyStressorParams(CommonStressorParams):
+    memcpy: int = field(
         metadata={
-            "name": "MQ count",
+            "name": "Memcpy workers",
             "description": (
-                "Number of MQ stressors to be run "
-                "(0 means 1 stressor per CPU)"
+                "start N workers that copy 2MB of data from a shared "
+                "region to a buffer using memcpy (0 means 1 stressor per "
+                "CPU)"
             ),
         }
     )
 
+    memcpy_method: typing.Optional[str] = field(
+        default=None,
+        metadata={
+            "name": "Memcpy method",
+            "description": (
+                "specify a memcpy copying method (all, libc, builtin, "
+                "naive etc.), the default is all"
+            ),
+        },
+    )
+
     def to_jobfile(self) -> str:
-        mq = "mq {}\n".format(self.mq)
-        result = mq
+        result = "memcpy {}\n".format(self.memcpy)
+        if self.memcpy_method is not None:
+            result = result + "memcpy-method {}\n".format(self.memcpy_method)
         return result
 
 
 @dataclass
-class HDDStressorParams(CommonStressorParams):
-    hdd: int = field(
+class CacheStressorParams(CommonStressorParams):
+    cache: int = field(
         metadata={
-            "name": "HDD workers",
+            "name": "Cache workers",
             "description": (
-                "start N workers continually writing, "
-                "reading and removing temporary files"
+                "start N workers that perform random wide spread memory "
+                "read and writes to thrash the CPU cache (0 means 1 "
+                "stressor per CPU)"
             ),
         }
     )
 
-    hdd_bytes: str = field(
+    cache_level: typing.Annotated[
+        typing.Optional[int], validation.min(1), validation.max(3)
+    ] = field(
+        default=None,
         metadata={
-            "name": "Bytes per worker",
+            "name": "Cache level",
             "description": (
-                "write  N  bytes for each hdd process, the default is 1 GB. "
-                "One can specify the size in units of Bytes, KBytes, "
-                "MBytes and GBytes using the suffix b, k, m or g."
+                "specify the level of cache to exercise (1=L1, 2=L2, "
+                "3=L3), the default is 3"
             ),
-        }
+        },
     )
 
-    hdd_write_size: str = field(
+    cache_ways: typing.Optional[int] = field(
+        default=None,
         metadata={
-            "name": "Write Size",
-            "description": (
-                "specify size of each write "
-                "in bytes. Size can be from 1 byte to 4MB"
-                "One can specify the size in units of Bytes, KBytes, "
-                "MBytes using the suffix b, k, m"
-            ),
-        }
+            "name": "Cache ways",
+            "description": "specify the number of cache ways to exercise",
+        },
     )
 
     def to_jobfile(self) -> str:
-        hdd = "hdd {}\n".format(self.hdd)
-        hdd_bytes = "hdd-bytes {}\n".format(self.hdd_bytes)
-        hdd_write_size = "hdd-write-size {}\n".format(self.hdd_write_size)
-        result = hdd + hdd_bytes + hdd_write_size
+        result = "cache {}\n".format(self.cache)
+        if self.cache_level is not None:
+            result = result + "cache-level {}\n".format(self.cache_level)
+        if self.cache_ways is not None:
+            result = result + "cache-ways {}\n".format(self.cache_ways)
         return result
 
 
 @dataclass
-class StressNGParams:
-    """
-    The parameters in this schema will be passed through to the stressng
-    command unchanged
-    """
-
-    timeout: str = field(
+class L1CacheStressorParams(CommonStressorParams):
+    l1cache: int = field(
         metadata={
-            "name": "Runtime",
-            "description": "Time to run the benchmark test",
+            "name": "L1 cache workers",
+            "description": (
+                "start N workers that exercise the CPU level 1 cache with "
+                "reads and writes (0 means 1 stressor per CPU)"
+            ),
         }
     )
 
-    stressors: typing.List[
-        typing.Annotated[
-            typing.Union[
-                typing.Annotated[
-                    CpuStressorParams,
-                    annotations.discriminator_value("cpu"),
-                    schema.name("CPU Stressor Parameters"),
-                    schema.description(
-                        "Parameters for running the cpu stressor"
-                    ),
-                ],
-                typing.Annotated[
-                    VmStressorParams,
-                    annotations.discriminator_value("vm"),
-                    schema.name("VM Stressor Parameters"),
-                    schema.description(
-                        "Parameters for running the vm stressor"
-                    ),
-                ],
-                typing.Annotated[
-                    MatrixStressorParams,
-                    annotations.discriminator_value("matrix"),
-                    schema.name("Matrix Stressor Parameters"),
-                    schema.description(
-                        "Parameters for running the matrix stressor"
-                    ),
-                ],
-                typing.Annotated[
-                    MqStressorParams,
-                    annotations.discriminator_value("mq"),
-                    schema.name("MQ Stressor Parameters"),
-                    schema.description(
-                        "Parameters for running the mq stressor"
-                    ),
-                ],
-                typing.Annotated[
-                    HDDStressorParams,
-                    annotations.discriminator_value("hdd"),
-                    schema.name("HDD Stressor Parameters"),
-                    schema.description(
-                        "Parameters for running the hdd stressor"
-                    ),
-                ],
-            ],
-            annotations.discriminator("stressor"),
-            schema.name("Stressors List"),
-            schema.description("List of stress-ng stressors and parameters"),
-        ]
-    ]
-    verbose: typing.Optional[bool] = field(
+    l1cache_line_size: typing.Optional[int] = field(
         default=None,
-        metadata={"name": "verbose", "description": "verbose output"},
+        metadata={
+            "name": "L1 cache line size",
+            "description": "specify the level 1 cache line size in bytes",
+        },
     )
-    metrics_brief: typing.Optional[bool] = field(
+
+    l1cache_sets: typing.Optional[int] = field(
         default=None,
         metadata={
-            "name": "brief metrics",
-            "description": "Brief version of the metrics output",
+            "name": "L1 cache sets",
+            "description": "specify the number of level 1 cache sets",
         },
     )
 
-    workdir: typing.Optional[str] = field(
+    l1cache_size: typing.Optional[int] = field(
         default=None,
         metadata={
-            "name": "Working Dir",
-            "description": (
-                "Path were stress-ng will be "
-                "executed (example to target a specific volume)"
-            ),
+            "name": "L1 cache size",
+            "description": "specify the level 1 cache size in bytes",
+        },
+    )
+
+    l1cache_ways: typing.Optional[int] = field(
+        default=None,
+        metadata={
+            "name": "L1 cache ways",
+            "description": "specify the number of level 1 cache ways",
         },
     )
 
     def to_jobfile(self) -> str:
-        result = "timeout {}\n".format(self.timeout)
-        if self.verbose is not None:
-            result = result + "verbose {}\n".format(self.verbose)
-        if self.metrics_brief is not None:
-            result = result + "metrics-brief {}\n".format(self.metrics_brief)
+        result = "l1cache {}\n".format(self.l1cache)
+        if self.l1cache_line_size is not None:
+            result = result + "l1cache-line-size {}\n".format(
+                self.l1cache_line_size
+            )
+        if self.l1cache_sets is not None:
+            result = result + "l1cache-sets {}\n".format(self.l1cache_sets)
+        if self.l1cache_size is not None:
+            result = result + "l1cache-size {}\n".format(self.l1cache_size)
+        if self.l1cache_ways is not None:
+            result = result + "l1cache-ways {}\n".format(self.l1cache_ways)
         return result
 
 
 @dataclass
-class WorkloadParams:
-    StressNGParams: typing.Annotated[
-        StressNGParams,
-        schema.name("Stress-NG Job Parameters"),
-        schema.description(
-            """
-            Global workload parameters and list of stressors
-            for the stress-ng job
-            """
-        ),
-    ]
-    cleanup: typing.Annotated[
-        typing.Optional[bool],
-        schema.name("Cleanup"),
-        schema.description("Cleanup artifacts after the plugin run"),
-    ] = False
-
-
-@dataclass
-class SystemInfoOutput:
-    stress_ng_version: str = dataclasses.field(
+class MatrixStressorParams(CommonStressorParams):
+    matrix: int = field(
         metadata={
-            "id": "stress-ng-version",
-            "name": "stress_ng_version",
-            "description": "version of the stressng tool used",
+            "name": "Matrix count",
+            "description": (
+                "Number of Matrix stressors to be "
+                "run (0 means 1 stressor per CPU"
+            ),
         }
     )
-    run_by: str = dataclasses.field(
+
+    matrix_method: typing.Optional[str] = field(
+        default=None,
         metadata={
-            "id": "run-by",
-            "name": "run_by",
-            "description": "username of the person who ran the test",
-        }
+            "name": "Matrix method",
+            "description": (
+                "specify a matrix stress method (all, add, copy, div, "
+                "frobenius, hadamard, mult, prod, transpose etc.), the "
+                "default is all"
+            ),
+        },
     )
-    date: str = dataclasses.field(
+
+    matrix_size: typing.Annotated[
+        typing.Optional[int], validation.min(1), validation.max(8192)
+    ] = field(
+        default=None,
         metadata={
-            "id": "date-yyyy-mm-dd",
-            "name": "date",
-            "description": "date on which the test was run",
-        }
+            "name": "Matrix size",
+            "description": (
+                "specify the N x N size of the matrices (1 to 8192), "
+                "smaller values are compute bound, larger values are cache "
+                "and memory bandwidth bound"
+            ),
+        },
+    )
+
+    matrix_yx: typing.Optional[bool] = field(
+        default=None,
+        metadata={
+            "name": "Matrix yx",
+            "description": (
+                "perform matrix operations in order y by x rather than the "
+                "default x by y"
+            ),
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        matrix = "matrix {}\n".format(self.matrix)
+        result = matrix
+        if self.matrix_method is not None:
+            result = result + "matrix-method {}\n".format(self.matrix_method)
+        if self.matrix_size is not None:
+            result = result + "matrix-size {}\n".format(self.matrix_size)
+        if self.matrix_yx:
+            result = result + "matrix-yx\n"
+        return result
+
+
+@dataclass
+class Matrix3dStressorParams(CommonStressorParams):
+    matrix_3d: int = field(
+        metadata={
+            "name": "Matrix 3D count",
+            "description": (
+                "Number of 3D Matrix stressors to be "
+                "run (0 means 1 stressor per CPU)"
+            ),
+        }
+    )
+
+    matrix_3d_method: typing.Optional[str] = field(
+        default=None,
+        metadata={
+            "name": "Matrix 3D method",
+            "description": (
+                "specify a 3D matrix stress method (all, add, copy, div, "
+                "frobenius, hadamard, mult, transpose etc.), the default "
+                "is all"
+            ),
+        },
+    )
+
+    matrix_3d_size: typing.Annotated[
+        typing.Optional[int], validation.min(1), validation.max(1024)
+    ] = field(
+        default=None,
+        metadata={
+            "name": "Matrix 3D size",
+            "description": (
+                "specify the N x N x N size of the matrices (1 to 1024)"
+            ),
+        },
+    )
+
+    matrix_3d_zyx: typing.Optional[bool] = field(
+        default=None,
+        metadata={
+            "name": "Matrix 3D zyx",
+            "description": (
+                "perform matrix operations in order z by y by x rather "
+                "than the default x by y by z"
+            ),
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        result = "matrix-3d {}\n".format(self.matrix_3d)
+        if self.matrix_3d_method is not None:
+            result = result + "matrix-3d-method {}\n".format(
+                self.matrix_3d_method
+            )
+        if self.matrix_3d_size is not None:
+            result = result + "matrix-3d-size {}\n".format(self.matrix_3d_size)
+        if self.matrix_3d_zyx:
+            result = result + "matrix-3d-zyx\n"
+        return result
+
+
+@dataclass
+class MqStressorParams(CommonStressorParams):
+    mq: int = field(
+        metadata={
+            "name": "MQ count",
+            "description": (
+                "Number of MQ stressors to be run "
+                "(0 means 1 stressor per CPU)"
+            ),
+        }
+    )
+
+    mq_size: typing.Annotated[
+        typing.Optional[int], validation.min(1), validation.max(32)
+    ] = field(
+        default=None,
+        metadata={
+            "name": "MQ size",
+            "description": (
+                "specify the size of the POSIX message queue (1 to 32), "
+                "the default is 10"
+            ),
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        mq = "mq {}\n".format(self.mq)
+        result = mq
+        if self.mq_size is not None:
+            result = result + "mq-size {}\n".format(self.mq_size)
+        return result
+
+
+@dataclass
+class PipeStressorParams(CommonStressorParams):
+    pipe: int = field(
+        metadata={
+            "name": "Pipe count",
+            "description": (
+                "Number of workers that perform large pipe writes and "
+                "reads to exercise pipe I/O (0 means 1 stressor per CPU)"
+            ),
+        }
+    )
+
+    pipe_data_size: typing.Optional[str] = field(
+        default=None,
+        metadata={
+            "name": "Pipe data size",
+            "description": (
+                "specify the size in bytes of each write to the pipe "
+                "(4 bytes to 4096 bytes), the default is 512 bytes"
+            ),
+        },
+    )
+
+    pipe_size: typing.Optional[str] = field(
+        default=None,
+        metadata={
+            "name": "Pipe size",
+            "description": (
+                "specify the size of the pipe in bytes, this is only "
+                "supported on Linux"
+            ),
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        result = "pipe {}\n".format(self.pipe)
+        if self.pipe_data_size is not None:
+            result = result + "pipe-data-size {}\n".format(self.pipe_data_size)
+        if self.pipe_size is not None:
+            result = result + "pipe-size {}\n".format(self.pipe_size)
+        return result
+
+
+@dataclass
+class SemStressorParams(CommonStressorParams):
+    sem: int = field(
+        metadata={
+            "name": "Semaphore count",
+            "description": (
+                "Number of workers that perform POSIX semaphore wait and "
+                "post operations (0 means 1 stressor per CPU)"
+            ),
+        }
+    )
+
+    sem_procs: typing.Annotated[
+        typing.Optional[int], validation.min(2), validation.max(64)
+    ] = field(
+        default=None,
+        metadata={
+            "name": "Semaphore processes",
+            "description": (
+                "start N child processes per worker to provide contention "
+                "on the semaphore (2 to 64), the default is 4"
+            ),
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        result = "sem {}\n".format(self.sem)
+        if self.sem_procs is not None:
+            result = result + "sem-procs {}\n".format(self.sem_procs)
+        return result
+
+
+@dataclass
+class FutexStressorParams(CommonStressorParams):
+    futex: int = field(
+        metadata={
+            "name": "Futex count",
+            "description": (
+                "Number of workers that rapidly exercise the futex wait "
+                "and wake system calls (0 means 1 stressor per CPU)"
+            ),
+        }
+    )
+
+    def to_jobfile(self) -> str:
+        result = "futex {}\n".format(self.futex)
+        return result
+
+
+@dataclass
+class MsgStressorParams(CommonStressorParams):
+    msg: int = field(
+        metadata={
+            "name": "Message count",
+            "description": (
+                "Number of workers that send and receive messages using "
+                "System V message IPC (0 means 1 stressor per CPU)"
+            ),
+        }
+    )
+
+    msg_types: typing.Annotated[
+        typing.Optional[int], validation.min(0), validation.max(100)
+    ] = field(
+        default=None,
+        metadata={
+            "name": "Message types",
+            "description": (
+                "select the quality of message types (mtype) to use (0 to "
+                "100), the default is 0 which means no types"
+            ),
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        result = "msg {}\n".format(self.msg)
+        if self.msg_types is not None:
+            result = result + "msg-types {}\n".format(self.msg_types)
+        return result
+
+
+@dataclass
+class SockStressorParams(CommonStressorParams):
+    sock: int = field(
+        metadata={
+            "name": "Socket count",
+            "description": (
+                "Number of workers that exercise socket I/O networking "
+                "between a client and server (0 means 1 stressor per CPU)"
+            ),
+        }
+    )
+
+    sock_domain: typing.Optional[SockDomain] = field(
+        default=None,
+        metadata={
+            "name": "Socket domain",
+            "description": (
+                "specify the domain to use (ipv4, ipv6 or unix), the "
+                "default is ipv4"
+            ),
+        },
+    )
+
+    sock_type: typing.Optional[SockType] = field(
+        default=None,
+        metadata={
+            "name": "Socket type",
+            "description": (
+                "specify the socket type to use (stream or seqpacket), the "
+                "default is stream"
+            ),
+        },
+    )
+
+    sock_opts: typing.Optional[SockOpts] = field(
+        default=None,
+        metadata={
+            "name": "Socket send options",
+            "description": (
+                "specify how data is sent (send, sendmsg, sendmmsg or "
+                "random), the default is send"
+            ),
+        },
+    )
+
+    sock_nodelay: typing.Optional[bool] = field(
+        default=None,
+        metadata={
+            "name": "Socket nodelay",
+            "description": "disable the TCP Nagle algorithm (TCP_NODELAY)",
+        },
+    )
+
+    sock_port: typing.Optional[int] = field(
+        default=None,
+        metadata={
+            "name": "Socket port",
+            "description": "start at socket port P, the default is 5000",
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        result = "sock {}\n".format(self.sock)
+        if self.sock_domain is not None:
+            result = result + "sock-domain {}\n".format(
+                SockDomain(self.sock_domain).value
+            )
+        if self.sock_type is not None:
+            result = result + "sock-type {}\n".format(
+                SockType(self.sock_type).value
+            )
+        if self.sock_opts is not None:
+            result = result + "sock-opts {}\n".format(
+                SockOpts(self.sock_opts).value
+            )
+        if self.sock_nodelay:
+            result = result + "sock-nodelay\n"
+        if self.sock_port is not None:
+            result = result + "sock-port {}\n".format(self.sock_port)
+        return result
+
+
+@dataclass
+class HDDStressorParams(CommonStressorParams):
+    hdd: int = field(
+        metadata={
+            "name": "HDD workers",
+            "description": (
+                "start N workers continually writing, "
+                "reading and removing temporary files"
+            ),
+        }
+    )
+
+    hdd_bytes: str = field(
+        metadata={
+            "name": "Bytes per worker",
+            "description": (
+                "write  N  bytes for each hdd process, the default is 1 GB. "
+                "One can specify the size in units of Bytes, KBytes, "
+                "MBytes and GBytes using the suffix b, k, m or g."
+            ),
+        }
+    )
+
+    hdd_write_size: str = field(
+        metadata={
+            "name": "Write Size",
+            "description": (
+                "specify size of each write "
+                "in bytes. Size can be from 1 byte to 4MB"
+                "One can specify the size in units of Bytes, KBytes, "
+                "MBytes using the suffix b, k, m"
+            ),
+        }
+    )
+
+    hdd_opts: typing.Optional[typing.List[HddOpts]] = field(
+        default=None,
+        metadata={
+            "name": "HDD options",
+            "description": (
+                "list of hdd stressor options, e.g. direct, sync, "
+                "fadv-seq, wr-seq, wr-rnd, rd-seq or rd-rnd. Only one "
+                "write pattern and one read pattern may be given, "
+                "fadv-seq conflicts with fadv-rnd, fadv-willneed with "
+                "fadv-dontneed and fadv-normal with all other fadv "
+                "options"
+            ),
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        hdd = "hdd {}\n".format(self.hdd)
+        hdd_bytes = "hdd-bytes {}\n".format(self.hdd_bytes)
+        hdd_write_size = "hdd-write-size {}\n".format(self.hdd_write_size)
+        result = hdd + hdd_bytes + hdd_write_size
+        if self.hdd_opts:
+            opts = [HddOpts(opt) for opt in self.hdd_opts]
+            for first, second in hdd_opts_conflicts:
+                if first in opts and second in opts:
+                    raise ValueError(
+                        "hdd-opts {} and {} are mutually exclusive".format(
+                            first.value, second.value
+                        )
+                    )
+            opts = [opt.value for opt in opts]
+            result = result + "hdd-opts {}\n".format(",".join(opts))
+        return result
+
+
+@dataclass
+class IomixStressorParams(CommonStressorParams):
+    iomix: int = field(
+        metadata={
+            "name": "IOMIX workers",
+            "description": (
+                "start N workers that perform a mix of sequential, random "
+                "and memory mapped read/write operations as well as "
+                "forced sync'ing and cache dropping"
+            ),
+        }
+    )
+
+    iomix_bytes: typing.Optional[str] = field(
+        default=None,
+        metadata={
+            "name": "Bytes per worker",
+            "description": (
+                "write N bytes for each iomix worker, the default is 1 GB. "
+                "One can specify the size as % of free space on the file "
+                "system or in units of Bytes, KBytes, MBytes and GBytes "
+                "using the suffix b, k, m or g."
+            ),
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        result = "iomix {}\n".format(self.iomix)
+        if self.iomix_bytes is not None:
+            result = result + "iomix-bytes {}\n".format(self.iomix_bytes)
+        return result
+
+
+@dataclass
+class AioStressorParams(CommonStressorParams):
+    aio: int = field(
+        metadata={
+            "name": "AIO workers",
+            "description": (
+                "start N workers that issue multiple small asynchronous "
+                "I/O writes and reads on a relatively small temporary file "
+                "using the POSIX aio interface"
+            ),
+        }
+    )
+
+    aio_requests: typing.Annotated[
+        typing.Optional[int], validation.min(1), validation.max(4096)
+    ] = field(
+        default=None,
+        metadata={
+            "name": "AIO requests",
+            "description": (
+                "specify the number of POSIX asynchronous I/O requests "
+                "each worker should issue, the default is 16; 1 to 4096 "
+                "are allowed"
+            ),
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        result = "aio {}\n".format(self.aio)
+        if self.aio_requests is not None:
+            result = result + "aio-requests {}\n".format(self.aio_requests)
+        return result
+
+
+@dataclass
+class AiolStressorParams(CommonStressorParams):
+    aiol: int = field(
+        metadata={
+            "name": "AIOL workers",
+            "description": (
+                "start N workers that issue asynchronous I/O writes and "
+                "reads using the Linux specific aio interface"
+            ),
+        }
+    )
+
+    aiol_requests: typing.Annotated[
+        typing.Optional[int], validation.min(1), validation.max(4096)
+    ] = field(
+        default=None,
+        metadata={
+            "name": "AIOL requests",
+            "description": (
+                "specify the number of Linux asynchronous I/O requests "
+                "each worker should issue, the default is 16; 1 to 4096 "
+                "are allowed"
+            ),
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        result = "aiol {}\n".format(self.aiol)
+        if self.aiol_requests is not None:
+            result = result + "aiol-requests {}\n".format(self.aiol_requests)
+        return result
+
+
+@dataclass
+class ReadaheadStressorParams(CommonStressorParams):
+    readahead: int = field(
+        metadata={
+            "name": "Readahead workers",
+            "description": (
+                "start N workers that randomly seek and perform 4096 byte "
+                "read/write I/O operations on a file with readahead"
+            ),
+        }
+    )
+
+    readahead_bytes: typing.Optional[str] = field(
+        default=None,
+        metadata={
+            "name": "Readahead file size",
+            "description": (
+                "set the size of file to readahead, the default is 1 GB. "
+                "One can specify the size as % of free space on the file "
+                "system or in units of Bytes, KBytes, MBytes and GBytes "
+                "using the suffix b, k, m or g."
+            ),
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        result = "readahead {}\n".format(self.readahead)
+        if self.readahead_bytes is not None:
+            result = result + "readahead-bytes {}\n".format(
+                self.readahead_bytes
+            )
+        return result
+
+
+@dataclass
+class CyclicStressorParams(CommonStressorParams):
+    cyclic: int = field(
+        metadata={
+            "name": "Cyclic count",
+            "description": (
+                "Number of workers that measure the wakeup latency of a "
+                "real time thread, run it alongside load stressors to "
+                "measure the scheduling jitter they induce. Requires "
+                "CAP_SYS_NICE, without it stress-ng skips the stressor "
+                "and its output is left unset"
+            ),
+        }
+    )
+
+    cyclic_policy: typing.Optional[CyclicPolicy] = field(
+        default=None,
+        metadata={
+            "name": "Cyclic policy",
+            "description": (
+                "specify the scheduling policy (deadline, fifo or rr), the "
+                "default is fifo"
+            ),
+        },
+    )
+
+    cyclic_prio: typing.Annotated[
+        typing.Optional[int], validation.min(1), validation.max(100)
+    ] = field(
+        default=None,
+        metadata={
+            "name": "Cyclic priority",
+            "description": (
+                "specify the scheduling priority (1 to 100), the default "
+                "is the maximum priority of the policy"
+            ),
+        },
+    )
+
+    cyclic_sleep: typing.Optional[int] = field(
+        default=None,
+        metadata={
+            "name": "Cyclic sleep",
+            "description": (
+                "sleep time in nanoseconds between latency measurements, "
+                "the default is 10000"
+            ),
+        },
+    )
+
+    cyclic_method: typing.Optional[CyclicMethod] = field(
+        default=None,
+        metadata={
+            "name": "Cyclic method",
+            "description": (
+                "specify the sleep method (clock_ns, itimer, poll, "
+                "posix_ns, pselect or usleep), the default is clock_ns"
+            ),
+        },
+    )
+
+    cyclic_dist: typing.Annotated[
+        typing.Optional[int], validation.min(1)
+    ] = field(
+        default=None,
+        metadata={
+            "name": "Cyclic distribution",
+            "description": (
+                "report a latency histogram with buckets of the given "
+                "width in nanoseconds"
+            ),
+        },
+    )
+
+    cyclic_samples: typing.Annotated[
+        typing.Optional[int], validation.min(1), validation.max(10000000)
+    ] = field(
+        default=None,
+        metadata={
+            "name": "Cyclic samples",
+            "description": (
+                "number of latency samples to take (1 to 10000000), the "
+                "default is 10000"
+            ),
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        result = "cyclic {}\n".format(self.cyclic)
+        if self.cyclic_policy is not None:
+            result = result + "cyclic-policy {}\n".format(
+                CyclicPolicy(self.cyclic_policy).value
+            )
+        if self.cyclic_prio is not None:
+            result = result + "cyclic-prio {}\n".format(self.cyclic_prio)
+        if self.cyclic_sleep is not None:
+            result = result + "cyclic-sleep {}\n".format(self.cyclic_sleep)
+        if self.cyclic_method is not None:
+            result = result + "cyclic-method {}\n".format(
+                CyclicMethod(self.cyclic_method).value
+            )
+        if self.cyclic_dist is not None:
+            result = result + "cyclic-dist {}\n".format(self.cyclic_dist)
+        if self.cyclic_samples is not None:
+            result = result + "cyclic-samples {}\n".format(self.cyclic_samples)
+        return result
+
+
+@dataclass
+class StressNGParams:
+    """
+    The parameters in this schema will be passed through to the stressng
+    command unchanged
+    """
+
+    timeout: str = field(
+        metadata={
+            "name": "Runtime",
+            "description": "Time to run the benchmark test",
+        }
+    )
+
+    stressors: typing.List[
+        typing.Annotated[
+            typing.Union[
+                typing.Annotated[
+                    CpuStressorParams,
+                    annotations.discriminator_value("cpu"),
+                    schema.name("CPU Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the cpu stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    VmStressorParams,
+                    annotations.discriminator_value("vm"),
+                    schema.name("VM Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the vm stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    MatrixStressorParams,
+                    annotations.discriminator_value("matrix"),
+                    schema.name("Matrix Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the matrix stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    Matrix3dStressorParams,
+                    annotations.discriminator_value("matrix-3d"),
+                    schema.name("Matrix 3D Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the matrix-3d stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    MqStressorParams,
+                    annotations.discriminator_value("mq"),
+                    schema.name("MQ Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the mq stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    PipeStressorParams,
+                    annotations.discriminator_value("pipe"),
+                    schema.name("Pipe Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the pipe stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    SemStressorParams,
+                    annotations.discriminator_value("sem"),
+                    schema.name("Semaphore Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the sem stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    FutexStressorParams,
+                    annotations.discriminator_value("futex"),
+                    schema.name("Futex Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the futex stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    MsgStressorParams,
+                    annotations.discriminator_value("msg"),
+                    schema.name("Message Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the msg stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    SockStressorParams,
+                    annotations.discriminator_value("sock"),
+                    schema.name("Socket Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the sock stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    CyclicStressorParams,
+                    annotations.discriminator_value("cyclic"),
+                    schema.name("Cyclic Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the cyclic stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    HDDStressorParams,
+                    annotations.discriminator_value("hdd"),
+                    schema.name("HDD Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the hdd stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    IomixStressorParams,
+                    annotations.discriminator_value("iomix"),
+                    schema.name("IOMIX Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the iomix stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    AioStressorParams,
+                    annotations.discriminator_value("aio"),
+                    schema.name("AIO Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the aio stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    AiolStressorParams,
+                    annotations.discriminator_value("aiol"),
+                    schema.name("AIOL Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the aiol stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    ReadaheadStressorParams,
+                    annotations.discriminator_value("readahead"),
+                    schema.name("Readahead Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the readahead stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    StreamStressorParams,
+                    annotations.discriminator_value("stream"),
+                    schema.name("Stream Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the stream stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    MemcpyStressorParams,
+                    annotations.discriminator_value("memcpy"),
+                    schema.name("Memcpy Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the memcpy stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    CacheStressorParams,
+                    annotations.discriminator_value("cache"),
+                    schema.name("Cache Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the cache stressor"
+                    ),
+                ],
+                typing.Annotated[
+                    L1CacheStressorParams,
+                    annotations.discriminator_value("l1cache"),
+                    schema.name("L1 Cache Stressor Parameters"),
+                    schema.description(
+                        "Parameters for running the l1cache stressor"
+                    ),
+                ],
+            ],
+            annotations.discriminator("stressor"),
+            schema.name("Stressors List"),
+            schema.description("List of stress-ng stressors and parameters"),
+        ]
+    ]
+    verbose: typing.Optional[bool] = field(
+        default=None,
+        metadata={"name": "verbose", "description": "verbose output"},
+    )
+    metrics_brief: typing.Optional[bool] = field(
+        default=None,
+        metadata={
+            "name": "brief metrics",
+            "description": "Brief version of the metrics output",
+        },
+    )
+
+    workdir: typing.Optional[str] = field(
+        default=None,
+        metadata={
+            "name": "Working Dir",
+            "description": (
+                "Path were stress-ng will be "
+                "executed (example to target a specific volume)"
+            ),
+        },
+    )
+
+    taskset: typing.Optional[str] = field(
+        default=None,
+        metadata={
+            "name": "Taskset",
+            "description": (
+                "list of CPUs the stressors are pinned to (e.g. 0,2-3), "
+                "pinning them to the CPUs of a NUMA node measures the "
+                "memory bandwidth of that node"
+            ),
+        },
+    )
+
+    perf: typing.Optional[bool] = field(
+        default=None,
+        metadata={
+            "name": "perf counters",
+            "description": (
+                "measure processor and system activity using perf "
+                "events, required for the cache miss results"
+            ),
+        },
+    )
+
+    def to_jobfile(self) -> str:
+        result = "timeout {}\n".format(self.timeout)
+        if self.verbose is not None:
+            result = result + "verbose {}\n".format(self.verbose)
+        if self.metrics_brief is not None:
+            result = result + "metrics-brief {}\n".format(self.metrics_brief)
+        if self.taskset is not None:
+            result = result + "taskset {}\n".format(self.taskset)
+        if self.perf:
+            result = result + "perf\n"
+        return result
+
+
+@dataclass
+class CacheParams:
+    path: str = field(
+        metadata={
+            "name": "Cache path",
+            "description": "Path to the SQLite database holding cached results",
+        }
+    )
+    ttl: typing.Optional[int] = field(
+        default=86400,
+        metadata={
+            "name": "Cache TTL",
+            "description": (
+                "Number of seconds a cached result stays valid, older "
+                "entries are evicted"
+            ),
+        },
+    )
+    max_entries: typing.Optional[int] = field(
+        default=100,
+        metadata={
+            "name": "Maximum cache entries",
+            "description": (
+                "Maximum number of cached results to keep, the oldest "
+                "entries are evicted first"
+            ),
+        },
+    )
+
+
+class ExportFormat(enum.Enum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+    CSV = "csv"
+
+
+@dataclass
+class ExportParams:
+    path: str = field(
+        metadata={
+            "name": "Export path",
+            "description": "Directory the result tables are written to",
+        }
+    )
+    format: typing.Optional[ExportFormat] = field(
+        default=ExportFormat.PARQUET,
+        metadata={
+            "name": "Export format",
+            "description": (
+                "File format of the result tables (parquet, arrow or csv), "
+                "parquet and arrow fall back to csv when pyarrow is not "
+                "installed"
+            ),
+        },
+    )
+
+
+@dataclass
+class MetricsParams:
+    textfile: typing.Optional[str] = field(
+        default=None,
+        metadata={
+            "name": "Textfile",
+            "description": (
+                "Path of a node_exporter textfile collector file the "
+                "metrics are written to (should end in .prom)"
+            ),
+        },
+    )
+    port: typing.Optional[int] = field(
+        default=None,
+        metadata={
+            "name": "HTTP port",
+            "description": (
+                "Port of a local HTTP endpoint serving the metrics while "
+                "the step runs (0 picks a free port). The endpoint stops "
+                "right after the final results are published, use the "
+                "textfile to keep them around for later scrapes."
+            ),
+        },
+    )
+    address: typing.Optional[str] = field(
+        default="127.0.0.1",
+        metadata={
+            "name": "HTTP address",
+            "description": "Address the HTTP endpoint listens on",
+        },
+    )
+    interval: typing.Annotated[
+        typing.Optional[float], validation.min(0.1)
+    ] = field(
+        default=1.0,
+        metadata={
+            "name": "Update interval",
+            "description": "Seconds between metric updates during the run",
+        },
+    )
+
+
+@dataclass
+class EnergyParams:
+    sysfs: typing.Optional[str] = field(
+        default="/sys",
+        metadata={
+            "name": "Sysfs root",
+            "description": (
+                "Directory the powercap, hwmon and thermal sysfs classes "
+                "are read from"
+            ),
+        },
+    )
+    interval: typing.Annotated[
+        typing.Optional[float], validation.min(0.1)
+    ] = field(
+        default=1.0,
+        metadata={
+            "name": "Sample interval",
+            "description": (
+                "Seconds between samples of the energy counters and "
+                "temperatures during the run"
+            ),
+        },
+    )
+
+
+@dataclass
+class ProfileParams:
+    cprofile: typing.Optional[bool] = field(
+        default=False,
+        metadata={
+            "name": "cProfile",
+            "description": (
+                "Run cProfile around the phases of the plugin outside of "
+                "the stress-ng runtime"
+            ),
+        },
+    )
+    tracemalloc: typing.Optional[bool] = field(
+        default=False,
+        metadata={
+            "name": "tracemalloc",
+            "description": (
+                "Trace the memory allocations of the plugin with "
+                "tracemalloc"
+            ),
+        },
+    )
+    limit: typing.Optional[int] = field(
+        default=20,
+        metadata={
+            "name": "Limit",
+            "description": (
+                "Number of functions and allocation sites included in the "
+                "cProfile and tracemalloc statistics"
+            ),
+        },
+    )
+
+
+class PreflightAction(enum.Enum):
+    FAIL = "fail"
+    SCALE = "scale"
+
+
+@dataclass
+class PreflightParams:
+    action: typing.Optional[PreflightAction] = field(
+        default=PreflightAction.FAIL,
+        metadata={
+            "name": "Preflight action",
+            "description": (
+                "What to do when the stressors need more memory or disk "
+                "space than is available: fail before starting stress-ng, "
+                "or scale the sizes of the stressors down to fit"
+            ),
+        },
+    )
+    memory_headroom: typing.Annotated[
+        typing.Optional[float], validation.min(0.0), validation.max(99.0)
+    ] = field(
+        default=10.0,
+        metadata={
+            "name": "Memory headroom",
+            "description": (
+                "Percentage of the available memory that is kept free"
+            ),
+        },
+    )
+    disk_headroom: typing.Annotated[
+        typing.Optional[float], validation.min(0.0), validation.max(99.0)
+    ] = field(
+        default=10.0,
+        metadata={
+            "name": "Disk headroom",
+            "description": (
+                "Percentage of the free space in the working directory "
+                "that is kept free"
+            ),
+        },
+    )
+
+
+@dataclass
+class WorkloadParams:
+    StressNGParams: typing.Annotated[
+        StressNGParams,
+        schema.name("Stress-NG Job Parameters"),
+        schema.description(
+            """
+            Global workload parameters and list of stressors
+            for the stress-ng job
+            """
+        ),
+    ]
+    cleanup: typing.Annotated[
+        typing.Optional[bool],
+        schema.name("Cleanup"),
+        schema.description("Cleanup artifacts after the plugin run"),
+    ] = False
+    results_store: typing.Annotated[
+        typing.Optional[str],
+        schema.name("Results store"),
+        schema.description(
+            "Path to a local SQLite database where the results of the run "
+            "are archived, keyed by host fingerprint and jobfile hash"
+        ),
+    ] = None
+    cache: typing.Annotated[
+        typing.Optional[CacheParams],
+        schema.name("Result cache"),
+        schema.description(
+            "Return the previous results instead of running stress-ng when "
+            "the same jobfile was already run with the same stress-ng "
+            "version, kernel release and CPU model"
+        ),
+    ] = None
+    export: typing.Annotated[
+        typing.Optional[ExportParams],
+        schema.name("Columnar export"),
+        schema.description(
+            "Write the system info and per-stressor metrics as columnar "
+            "files in addition to returning them"
+        ),
+    ] = None
+    metrics: typing.Annotated[
+        typing.Optional[MetricsParams],
+        schema.name("Prometheus metrics"),
+        schema.description(
+            "Expose live run progress, host telemetry and the final "
+            "results in the OpenMetrics text format"
+        ),
+    ] = None
+    preflight: typing.Annotated[
+        typing.Optional[PreflightParams],
+        schema.name("Preflight check"),
+        schema.description(
+            "Check the memory and disk space the stressors need against "
+            "the available memory and the free space in the working "
+            "directory before running stress-ng"
+        ),
+    ] = None
+    energy: typing.Annotated[
+        typing.Optional[EnergyParams],
+        schema.name("Energy"),
+        schema.description(
+            "Sample the RAPL package and DRAM energy counters and the "
+            "hwmon and thermal zone temperatures during the run"
+        ),
+    ] = None
+    profile: typing.Annotated[
+        typing.Optional[ProfileParams],
+        schema.name("Profile"),
+        schema.description(
+            "Record how long each phase of the plugin takes to tell the "
+            "plugin overhead apart from the stress-ng runtime"
+        ),
+    ] = None
+
+
+@dataclass
+class SystemInfoOutput:
+    stress_ng_version: str = dataclasses.field(
+        metadata={
+            "id": "stress-ng-version",
+            "name": "stress_ng_version",
+            "description": "version of the stressng tool used",
+        }
+    )
+    run_by: str = dataclasses.field(
+        metadata={
+            "id": "run-by",
+            "name": "run_by",
+            "description": "username of the person who ran the test",
+        }
+    )
+    date: str = dataclasses.field(
+        metadata={
+            "id": "date-yyyy-mm-dd",
+            "name": "date",
+            "description": "date on which the test was run",
+        }
+    )
+    time: str = dataclasses.field(
+        metadata={
+            "id": "time-hh-mm-ss",
+            "name": "time",
+            "description": "time at which the test was run",
+        }
+    )
+    epoch: int = dataclasses.field(
+        metadata={
+            "id": "epoch-secs",
+            "name": "epoch",
+            "description": "epoch at which the test was run",
+        }
+    )
+    hostname: str = field(
+        metadata={
+            "name": "hostname",
+            "description": "host on which the test was run",
+        }
+    )
+    sysname: str = field(
+        metadata={"name": "system name", "description": "System name"}
+    )
+    nodename: str = field(
+        metadata={
+            "name": "nodename",
+            "description": "name of the node on which the test was run",
+        }
+    )
+    release: str = field(
+        metadata={
+            "name": "release",
+            "description": "kernel release on which the test was run",
+        }
+    )
+    version: str = field(
+        metadata={
+            "name": "version",
+            "description": "version on which the test was run",
+        }
+    )
+    machine: str = field(
+        metadata={
+            "name": "machine",
+            "description": "machine type on which the test was run",
+        }
+    )
+    uptime: int = field(
+        metadata={
+            "name": "uptime",
+            "description": "uptime of the machine the test was run on",
+        }
+    )
+    totalram: int = field(
+        metadata={
+            "name": "totalram",
+            "description": "total amount of RAM the test machine had",
+        }
+    )
+    freeram: int = field(
+        metadata={
+            "name": "freeram",
+            "description": "amount of free RAM the test machine had",
+        }
+    )
+    sharedram: int = field(
+        metadata={
+            "name": "sharedram",
+            "description": "amount of shared RAM the test machine had",
+        }
+    )
+    bufferram: int = field(
+        metadata={
+            "name": "bufferram",
+            "description": "amount of buffer RAM the test machine had",
+        }
+    )
+    totalswap: int = field(
+        metadata={
+            "name": "totalswap",
+            "description": "total amount of swap the test machine had",
+        }
+    )
+    freeswap: int = field(
+        metadata={
+            "name": "freeswap",
+            "description": "amount of free swap the test machine had",
+        }
+    )
+    pagesize: int = field(
+        metadata={
+            "name": "pagesize",
+            "description": "memory page size the test machine used",
+        }
+    )
+    cpus: int = field(
+        metadata={
+            "name": "cpus",
+            "description": "number of CPU cores the test machine had",
+        }
+    )
+    cpus_online: int = dataclasses.field(
+        metadata={
+            "id": "cpus-online",
+            "name": "cpus_online",
+            "description": "number of online CPUs the test machine had",
+        }
+    )
+    ticks_per_second: int = dataclasses.field(
+        metadata={
+            "id": "ticks-per-second",
+            "name": "ticks_per_second",
+            "description": "ticks per second used on the test machine",
+        }
+    )
+
+
+system_info_output_schema = plugin.build_object_schema(SystemInfoOutput)
+
+
+@dataclass
+class MiscMetricOutput:
+    description: str = field(
+        metadata={
+            "name": "Description",
+            "description": "Description of the metric as reported by stress-ng",
+        }
+    )
+    value: float = field(
+        metadata={
+            "name": "Value",
+            "description": "Value of the metric",
+        }
+    )
+
+
+@dataclass
+class CommonOutput:
+    stressor: str = dataclasses.field(
+        metadata={
+            "name": "Stressor",
+            "description": "Type of stressor for workload",
+        }
+    )
+    max_rss: str = dataclasses.field(
+        metadata={
+            "id": "max-rss",
+            "name": "Max RSS",
+            "description": "Maximum resident set size",
+        }
+    )
+    bogo_ops: int = dataclasses.field(
+        metadata={
+            "id": "bogo-ops",
+            "name": "Bogus Operations",
+            "description": "Number of stressor loop iterations",
+        }
+    )
+    bogo_ops_per_second_usr_sys_time: float = dataclasses.field(
+        metadata={
+            "id": "bogo-ops-per-second-usr-sys-time",
+            "name": "Bogus operations per second per user and sys time",
+            "description": (
+                "is the bogo-ops rate divided by the user + system time."
+                "This is the real per CPU throughput "
+                "taking into consideration "
+                "all the CPUs used and all the time consumed "
+                "by the stressor and kernel time."
+            ),
+        }
+    )
+    bogo_ops_per_second_real_time: float = dataclasses.field(
+        metadata={
+            "id": "bogo-ops-per-second-real-time",
+            "name": "Bogus operations per second in real time",
+            "description": (
+                "real time measurement is how long the run took based "
+                "on the wall clock time "
+                "(that is, the time the stressor took to run)."
+            ),
+        }
+    )
+    wall_clock_time: float = dataclasses.field(
+        metadata={
+            "id": "wall-clock-time",
+            "name": "Wall Clock Time",
+            "description": "The time the stressor took to run",
+        }
+    )
+    user_time: float = dataclasses.field(
+        metadata={
+            "id": "user-time",
+            "name": "CPU User Time",
+            "description": "The CPU time spent in user space",
+        }
+    )
+    system_time: float = dataclasses.field(
+        metadata={
+            "id": "system-time",
+            "name": "CPU System Time",
+            "description": "The CPU time spent in kernel space",
+        }
+    )
+    cpu_usage_per_instance: float = dataclasses.field(
+        metadata={
+            "id": "cpu-usage-per-instance",
+            "name": "CPU usage per instance",
+            "description": (
+                "is the amount of CPU " "used by each stressor instance"
+            ),
+        }
+    )
+    misc_metrics: typing.Optional[
+        typing.List[MiscMetricOutput]
+    ] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "misc-metrics",
+            "name": "Miscellaneous metrics",
+            "description": (
+                "Stressor specific metrics reported by stress-ng, such as "
+                "throughput or latency"
+            ),
+        },
+    )
+    energy: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "name": "Energy",
+            "description": (
+                "Joules of package and DRAM energy attributed to the "
+                "stressor, concurrent stressors share the energy by their "
+                "user + system time"
+            ),
+        },
+    )
+    average_power: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "average-power",
+            "name": "Average power",
+            "description": (
+                "Energy attributed to the stressor divided by its wall "
+                "clock time in watts"
+            ),
+        },
+    )
+    bogo_ops_per_joule: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "bogo-ops-per-joule",
+            "name": "Bogus operations per joule",
+            "description": (
+                "Bogo-ops divided by the energy attributed to the stressor"
+            ),
+        },
+    )
+
+
+@dataclass
+class VMOutput(CommonOutput):
+    """
+    This is the data structure that holds the results for the VM stressor
+    """
+
+
+vm_output_schema = plugin.build_object_schema(VMOutput)
+
+
+@dataclass
+class CPUOutput(CommonOutput):
+    """
+    This is the data structure that holds the results for the CPU stressor
+    """
+
+
+cpu_output_schema = plugin.build_object_schema(CPUOutput)
+
+
+@dataclass
+class MatrixOutput(CommonOutput):
+    """
+    This is the data structure that holds the results for the Matrix stressor
+    """
+
+    workers: typing.Optional[int] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "workers",
+            "name": "Workers",
+            "description": "Number of workers that ran the stressor",
+        },
     )
-    time: str = dataclasses.field(
+    ops_per_second_per_worker: typing.Optional[float] = dataclasses.field(
+        default=None,
         metadata={
-            "id": "time-hh-mm-ss",
-            "name": "time",
-            "description": "time at which the test was run",
+            "id": "ops-per-second-per-worker",
+            "name": "Operations per second per worker",
+            "description": (
+                "Matrix operations per second of wall clock time divided "
+                "by the number of workers"
+            ),
+        },
+    )
+    element_ops_per_second_per_worker: typing.Optional[
+        float
+    ] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "element-ops-per-second-per-worker",
+            "name": "Element operations per second per worker",
+            "description": (
+                "Operations per second per worker multiplied by the number "
+                "of matrix elements (size squared, or cubed for 3D "
+                "matrices), only set when the matrix size is given"
+            ),
+        },
+    )
+
+
+matrix_output_schema = plugin.build_object_schema(MatrixOutput)
+
+
+@dataclass
+class Matrix3dOutput(MatrixOutput):
+    """
+    This is the data structure that holds the results for the 3D Matrix
+    stressor
+    """
+
+
+matrix_3d_output_schema = plugin.build_object_schema(Matrix3dOutput)
+
+
+@dataclass
+class IPCOutput(CommonOutput):
+    """
+    This is the data structure that holds the results shared by the IPC
+    stressors
+    """
+
+    workers: typing.Optional[int] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "workers",
+            "name": "Workers",
+            "description": "Number of workers that ran the stressor",
+        },
+    )
+    mean_op_latency: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "mean-op-latency-ns",
+            "name": "Mean operation latency",
+            "description": (
+                "Mean wall clock time of a single operation of a worker in "
+                "nanoseconds, derived from the bogo-ops rate"
+            ),
+        },
+    )
+    reported_latency: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "reported-latency-ns",
+            "name": "Reported latency",
+            "description": (
+                "Per operation latency in nanoseconds as reported by the "
+                "stressor in its miscellaneous metrics"
+            ),
+        },
+    )
+    throughput: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "throughput",
+            "name": "Throughput",
+            "description": (
+                "Data throughput in MB per second as reported by the "
+                "stressor in its miscellaneous metrics"
+            ),
+        },
+    )
+
+
+@dataclass
+class MQOutput(IPCOutput):
+    """
+    This is the data structure that holds the results for the MQ stressor
+    """
+
+
+mq_output_schema = plugin.build_object_schema(MQOutput)
+
+
+@dataclass
+class PipeOutput(IPCOutput):
+    """
+    This is the data structure that holds the results for the Pipe stressor
+    """
+
+
+pipe_output_schema = plugin.build_object_schema(PipeOutput)
+
+
+@dataclass
+class SemOutput(IPCOutput):
+    """
+    This is the data structure that holds the results for the Semaphore
+    stressor
+    """
+
+
+sem_output_schema = plugin.build_object_schema(SemOutput)
+
+
+@dataclass
+class FutexOutput(IPCOutput):
+    """
+    This is the data structure that holds the results for the Futex stressor
+    """
+
+
+futex_output_schema = plugin.build_object_schema(FutexOutput)
+
+
+@dataclass
+class MsgOutput(IPCOutput):
+    """
+    This is the data structure that holds the results for the Message
+    stressor
+    """
+
+
+msg_output_schema = plugin.build_object_schema(MsgOutput)
+
+
+@dataclass
+class SockOutput(IPCOutput):
+    """
+    This is the data structure that holds the results for the Socket
+    stressor
+    """
+
+
+sock_output_schema = plugin.build_object_schema(SockOutput)
+
+
+@dataclass
+class LatencyPercentileOutput:
+    percentile: float = field(
+        metadata={
+            "name": "Percentile",
+            "description": "Percentile of the latency samples",
         }
     )
-    epoch: int = dataclasses.field(
+    latency: float = field(
         metadata={
-            "id": "epoch-secs",
-            "name": "epoch",
-            "description": "epoch at which the test was run",
+            "name": "Latency",
+            "description": "Latency at the percentile in nanoseconds",
         }
     )
-    hostname: str = field(
+
+
+@dataclass
+class LatencyBucketOutput:
+    latency: int = field(
         metadata={
-            "name": "hostname",
-            "description": "host on which the test was run",
+            "name": "Latency",
+            "description": "Lower bound of the bucket in nanoseconds",
         }
     )
-    sysname: str = field(
-        metadata={"name": "system name", "description": "System name"}
+    count: int = field(
+        metadata={
+            "name": "Count",
+            "description": "Number of latency samples in the bucket",
+        }
+    )
+
+
+@dataclass
+class CyclicOutput(CommonOutput):
+    """
+    This is the data structure that holds the results for the Cyclic stressor
+    """
+
+    latency_mean: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "latency-mean-ns",
+            "name": "Mean latency",
+            "description": "Mean wakeup latency in nanoseconds",
+        },
+    )
+    latency_min: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "latency-min-ns",
+            "name": "Minimum latency",
+            "description": "Minimum wakeup latency in nanoseconds",
+        },
+    )
+    latency_max: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "latency-max-ns",
+            "name": "Maximum latency",
+            "description": "Maximum wakeup latency in nanoseconds",
+        },
+    )
+    latency_stddev: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "latency-stddev-ns",
+            "name": "Latency standard deviation",
+            "description": (
+                "Standard deviation of the wakeup latency in nanoseconds"
+            ),
+        },
+    )
+    latency_percentiles: typing.Optional[
+        typing.List[LatencyPercentileOutput]
+    ] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "latency-percentiles",
+            "name": "Latency percentiles",
+            "description": "Wakeup latency percentiles reported by stress-ng",
+        },
+    )
+    latency_histogram: typing.Optional[
+        typing.List[LatencyBucketOutput]
+    ] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "latency-histogram",
+            "name": "Latency histogram",
+            "description": (
+                "Wakeup latency distribution, only reported when "
+                "cyclic_dist is set"
+            ),
+        },
+    )
+
+
+cyclic_output_schema = plugin.build_object_schema(CyclicOutput)
+
+
+@dataclass
+class HDDOutput(CommonOutput):
+    """
+    This is the data structure that holds the results for the HDD stressor
+    """
+
+    read_rate: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "read-rate",
+            "name": "Read rate",
+            "description": "Read throughput in MB per second",
+        },
+    )
+    write_rate: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "write-rate",
+            "name": "Write rate",
+            "description": "Write throughput in MB per second",
+        },
+    )
+
+
+hdd_output_schema = plugin.build_object_schema(HDDOutput)
+
+
+@dataclass
+class IomixOutput(CommonOutput):
+    """
+    This is the data structure that holds the results for the IOMIX stressor
+    """
+
+
+iomix_output_schema = plugin.build_object_schema(IomixOutput)
+
+
+@dataclass
+class AioOutput(CommonOutput):
+    """
+    This is the data structure that holds the results for the AIO stressor
+    """
+
+
+aio_output_schema = plugin.build_object_schema(AioOutput)
+
+
+@dataclass
+class AiolOutput(CommonOutput):
+    """
+    This is the data structure that holds the results for the AIOL stressor
+    """
+
+
+aiol_output_schema = plugin.build_object_schema(AiolOutput)
+
+
+@dataclass
+class ReadaheadOutput(CommonOutput):
+    """
+    This is the data structure that holds the results for the Readahead
+    stressor
+    """
+
+
+readahead_output_schema = plugin.build_object_schema(ReadaheadOutput)
+
+
+@dataclass
+class StreamOutput(CommonOutput):
+    """
+    This is the data structure that holds the results for the Stream stressor
+    """
+
+    read_rate: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "read-rate",
+            "name": "Memory read rate",
+            "description": "Memory read bandwidth in MB per second",
+        },
+    )
+    write_rate: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "write-rate",
+            "name": "Memory write rate",
+            "description": "Memory write bandwidth in MB per second",
+        },
+    )
+    mflops: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "mflops",
+            "name": "Mflop per second",
+            "description": "Double precision Mflop per second",
+        },
+    )
+
+
+stream_output_schema = plugin.build_object_schema(StreamOutput)
+
+
+@dataclass
+class MemcpyOutput(CommonOutput):
+    """
+    This is the data structure that holds the results for the Memcpy stressor
+    """
+
+    copy_rate: typing.Optional[float] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "copy-rate",
+            "name": "Copy rate",
+            "description": "Memory copy bandwidth in MB per second",
+        },
+    )
+
+
+memcpy_output_schema = plugin.build_object_schema(MemcpyOutput)
+
+
+@dataclass
+class CacheOutput(CommonOutput):
+    """
+    This is the data structure that holds the results for the Cache stressor
+    """
+
+    cache_references: typing.Optional[int] = dataclasses.field(
+        default=None,
+        metadata={
+            "id": "cache-references",
+            "name": "Cache references",
+            "description": "Number of cache references (requires perf)",
+        },
     )
-    nodename: str = field(
+    cache_misses: typing.Optional[int] = dataclasses.field(
+        default=None,
         metadata={
-            "name": "nodename",
-            "description": "name of the node on which the test was run",
-        }
+            "id": "cache-misses",
+            "name": "Cache misses",
+            "description": "Number of cache misses (requires perf)",
+        },
     )
-    release: str = field(
+    cache_miss_ratio: typing.Optional[float] = dataclasses.field(
+        default=None,
         metadata={
-            "name": "release",
-            "description": "kernel release on which the test was run",
-        }
+            "id": "cache-miss-ratio",
+            "name": "Cache miss ratio",
+            "description": "Cache misses divided by cache references",
+        },
     )
-    version: str = field(
+
+
+cache_output_schema = plugin.build_object_schema(CacheOutput)
+
+
+@dataclass
+class L1CacheOutput(CacheOutput):
+    """
+    This is the data structure that holds the results for the L1 Cache
+    stressor
+    """
+
+
+l1cache_output_schema = plugin.build_object_schema(L1CacheOutput)
+
+
+@dataclass
+class PreflightOutput:
+    memory_demand: int = field(
         metadata={
-            "name": "version",
-            "description": "version on which the test was run",
+            "name": "Memory demand",
+            "description": "Bytes of memory requested by the stressors",
         }
     )
-    machine: str = field(
+    memory_available: int = field(
         metadata={
-            "name": "machine",
-            "description": "machine type on which the test was run",
+            "name": "Memory available",
+            "description": "Bytes of memory available before the run",
         }
     )
-    uptime: int = field(
+    disk_demand: int = field(
         metadata={
-            "name": "uptime",
-            "description": "uptime of the machine the test was run on",
+            "name": "Disk demand",
+            "description": "Bytes of disk space requested by the stressors",
         }
     )
-    totalram: int = field(
+    disk_available: int = field(
         metadata={
-            "name": "totalram",
-            "description": "total amount of RAM the test machine had",
+            "name": "Disk available",
+            "description": (
+                "Bytes of free space in the working directory before the run"
+            ),
         }
     )
-    freeram: int = field(
+    memory_scale: typing.Optional[float] = field(
+        default=None,
         metadata={
-            "name": "freeram",
-            "description": "amount of free RAM the test machine had",
-        }
+            "name": "Memory scale",
+            "description": (
+                "Factor the memory sizes were scaled by, unset when they "
+                "were not scaled"
+            ),
+        },
     )
-    sharedram: int = field(
+    disk_scale: typing.Optional[float] = field(
+        default=None,
         metadata={
-            "name": "sharedram",
-            "description": "amount of shared RAM the test machine had",
-        }
+            "name": "Disk scale",
+            "description": (
+                "Factor the disk sizes were scaled by, unset when they "
+                "were not scaled"
+            ),
+        },
     )
-    bufferram: int = field(
+
+
+@dataclass
+class EnergyOutput:
+    duration: float = field(
         metadata={
-            "name": "bufferram",
-            "description": "amount of buffer RAM the test machine had",
+            "name": "Duration",
+            "description": "Seconds the energy counters were sampled for",
         }
     )
-    totalswap: int = field(
+    package_energy: typing.Optional[float] = field(
+        default=None,
         metadata={
-            "name": "totalswap",
-            "description": "total amount of swap the test machine had",
-        }
+            "name": "Package energy",
+            "description": (
+                "Joules consumed by all CPU packages, unset when the RAPL "
+                "counters are not available"
+            ),
+        },
     )
-    freeswap: int = field(
+    dram_energy: typing.Optional[float] = field(
+        default=None,
         metadata={
-            "name": "freeswap",
-            "description": "amount of free swap the test machine had",
-        }
+            "name": "DRAM energy",
+            "description": (
+                "Joules consumed by the DRAM, unset when the RAPL counters "
+                "are not available"
+            ),
+        },
     )
-    pagesize: int = field(
+    package_power: typing.Optional[float] = field(
+        default=None,
         metadata={
-            "name": "pagesize",
-            "description": "memory page size the test machine used",
-        }
+            "name": "Package power",
+            "description": "Average power of all CPU packages in watts",
+        },
     )
-    cpus: int = field(
+    dram_power: typing.Optional[float] = field(
+        default=None,
         metadata={
-            "name": "cpus",
-            "description": "number of CPU cores the test machine had",
-        }
+            "name": "DRAM power",
+            "description": "Average power of the DRAM in watts",
+        },
     )
-    cpus_online: int = dataclasses.field(
+    max_temperature: typing.Optional[float] = field(
+        default=None,
         metadata={
-            "id": "cpus-online",
-            "name": "cpus_online",
-            "description": "number of online CPUs the test machine had",
-        }
+            "name": "Maximum temperature",
+            "description": (
+                "Highest hwmon or thermal zone temperature in degrees "
+                "Celsius, unset when no sensors are available"
+            ),
+        },
     )
-    ticks_per_second: int = dataclasses.field(
+    average_temperature: typing.Optional[float] = field(
+        default=None,
         metadata={
-            "id": "ticks-per-second",
-            "name": "ticks_per_second",
-            "description": "ticks per second used on the test machine",
-        }
+            "name": "Average temperature",
+            "description": (
+                "Mean of all hwmon and thermal zone temperature samples in "
+                "degrees Celsius"
+            ),
+        },
     )
 
 
-system_info_output_schema = plugin.build_object_schema(SystemInfoOutput)
-
-
 @dataclass
-class CommonOutput:
-    stressor: str = dataclasses.field(
-        metadata={
-            "name": "Stressor",
-            "description": "Type of stressor for workload",
-        }
-    )
-    max_rss: str = dataclasses.field(
+class ProfilePhaseOutput:
+    phase: str = field(
         metadata={
-            "id": "max-rss",
-            "name": "Max RSS",
-            "description": "Maximum resident set size",
+            "name": "Phase",
+            "description": "Name of the phase of the plugin run",
         }
     )
-    bogo_ops: int = dataclasses.field(
+    duration: float = field(
         metadata={
-            "id": "bogo-ops",
-            "name": "Bogus Operations",
-            "description": "Number of stressor loop iterations",
+            "name": "Duration",
+            "description": "Seconds spent in the phase",
         }
     )
-    bogo_ops_per_second_usr_sys_time: float = dataclasses.field(
+
+
+@dataclass
+class ProfileOutput:
+    phases: typing.List[ProfilePhaseOutput] = field(
         metadata={
-            "id": "bogo-ops-per-second-usr-sys-time",
-            "name": "Bogus operations per second per user and sys time",
+            "name": "Phases",
             "description": (
-                "is the bogo-ops rate divided by the user + system time."
-                "This is the real per CPU throughput "
-                "taking into consideration "
-                "all the CPUs used and all the time consumed "
-                "by the stressor and kernel time."
+                "Time spent in each phase in the order the phases ran"
             ),
         }
     )
-    bogo_ops_per_second_real_time: float = dataclasses.field(
+    total: float = field(
         metadata={
-            "id": "bogo-ops-per-second-real-time",
-            "name": "Bogus operations per second in real time",
-            "description": (
-                "real time measurement is how long the run took based "
-                "on the wall clock time "
-                "(that is, the time the stressor took to run)."
-            ),
+            "name": "Total",
+            "description": "Seconds from the start to the end of the step",
         }
     )
-    wall_clock_time: float = dataclasses.field(
+    overhead: float = field(
         metadata={
-            "id": "wall-clock-time",
-            "name": "Wall Clock Time",
-            "description": "The time the stressor took to run",
+            "name": "Overhead",
+            "description": (
+                "Seconds of the total not spent waiting for stress-ng"
+            ),
         }
     )
-    user_time: float = dataclasses.field(
+    cprofile_stats: typing.Optional[str] = field(
+        default=None,
         metadata={
-            "id": "user-time",
-            "name": "CPU User Time",
-            "description": "The CPU time spent in user space",
-        }
+            "name": "cProfile statistics",
+            "description": (
+                "Functions with the highest cumulative time outside of the "
+                "stress-ng runtime"
+            ),
+        },
     )
-    system_time: float = dataclasses.field(
+    peak_memory: typing.Optional[int] = field(
+        default=None,
         metadata={
-            "id": "system-time",
-            "name": "CPU System Time",
-            "description": "The CPU time spent in kernel space",
-        }
+            "name": "Peak memory",
+            "description": "Peak bytes allocated as traced by tracemalloc",
+        },
     )
-    cpu_usage_per_instance: float = dataclasses.field(
+    tracemalloc_stats: typing.Optional[str] = field(
+        default=None,
         metadata={
-            "id": "cpu-usage-per-instance",
-            "name": "CPU usage per instance",
-            "description": (
-                "is the amount of CPU " "used by each stressor instance"
-            ),
-        }
+            "name": "tracemalloc statistics",
+            "description": "Source lines that allocated the most memory",
+        },
     )
 
 
-@dataclass
-class VMOutput(CommonOutput):
-    """
-    This is the data structure that holds the results for the VM stressor
-    """
-
-
-vm_output_schema = plugin.build_object_schema(VMOutput)
-
-
-@dataclass
-class CPUOutput(CommonOutput):
-    """
-    This is the data structure that holds the results for the CPU stressor
-    """
-
-
-cpu_output_schema = plugin.build_object_schema(CPUOutput)
-
-
-@dataclass
-class MatrixOutput(CommonOutput):
-    """
-    This is the data structure that holds the results for the Matrix stressor
-    """
-
-
-matrix_output_schema = plugin.build_object_schema(MatrixOutput)
-
-
-@dataclass
-class MQOutput(CommonOutput):
-    """
-    This is the data structure that holds the results for the MQ stressor
-    """
-
-
-mq_output_schema = plugin.build_object_schema(MQOutput)
-
-
-@dataclass
-class HDDOutput(CommonOutput):
-    """
-    This is the data structure that holds the results for the HDD stressor
-    """
-
-
-hdd_output_schema = plugin.build_object_schema(HDDOutput)
-
-
 @dataclass
 class WorkloadResults:
     systeminfo: typing.Annotated[
@@ -589,16 +2601,125 @@ class WorkloadResults:
         schema.name("Matrix Output"),
         schema.description("Matrix stressor output object"),
     ] = None
+    matrix3dinfo: typing.Annotated[
+        typing.Optional[Matrix3dOutput],
+        schema.name("Matrix 3D Output"),
+        schema.description("3D Matrix stressor output object"),
+    ] = None
     mqinfo: typing.Annotated[
         typing.Optional[MQOutput],
         schema.name("MQ Output"),
         schema.description("MQ stressor output object"),
     ] = None
+    pipeinfo: typing.Annotated[
+        typing.Optional[PipeOutput],
+        schema.name("Pipe Output"),
+        schema.description("Pipe stressor output object"),
+    ] = None
+    seminfo: typing.Annotated[
+        typing.Optional[SemOutput],
+        schema.name("Semaphore Output"),
+        schema.description("Semaphore stressor output object"),
+    ] = None
+    futexinfo: typing.Annotated[
+        typing.Optional[FutexOutput],
+        schema.name("Futex Output"),
+        schema.description("Futex stressor output object"),
+    ] = None
+    msginfo: typing.Annotated[
+        typing.Optional[MsgOutput],
+        schema.name("Message Output"),
+        schema.description("Message stressor output object"),
+    ] = None
+    sockinfo: typing.Annotated[
+        typing.Optional[SockOutput],
+        schema.name("Socket Output"),
+        schema.description("Socket stressor output object"),
+    ] = None
+    cyclicinfo: typing.Annotated[
+        typing.Optional[CyclicOutput],
+        schema.name("Cyclic Output"),
+        schema.description("Cyclic stressor output object"),
+    ] = None
     hddinfo: typing.Annotated[
         typing.Optional[HDDOutput],
         schema.name("HDD Output"),
         schema.description("HDD stressor output object"),
     ] = None
+    iomixinfo: typing.Annotated[
+        typing.Optional[IomixOutput],
+        schema.name("IOMIX Output"),
+        schema.description("IOMIX stressor output object"),
+    ] = None
+    aioinfo: typing.Annotated[
+        typing.Optional[AioOutput],
+        schema.name("AIO Output"),
+        schema.description("AIO stressor output object"),
+    ] = None
+    aiolinfo: typing.Annotated[
+        typing.Optional[AiolOutput],
+        schema.name("AIOL Output"),
+        schema.description("AIOL stressor output object"),
+    ] = None
+    readaheadinfo: typing.Annotated[
+        typing.Optional[ReadaheadOutput],
+        schema.name("Readahead Output"),
+        schema.description("Readahead stressor output object"),
+    ] = None
+    streaminfo: typing.Annotated[
+        typing.Optional[StreamOutput],
+        schema.name("Stream Output"),
+        schema.description("Stream stressor output object"),
+    ] = None
+    memcpyinfo: typing.Annotated[
+        typing.Optional[MemcpyOutput],
+        schema.name("Memcpy Output"),
+        schema.description("Memcpy stressor output object"),
+    ] = None
+    cacheinfo: typing.Annotated[
+        typing.Optional[CacheOutput],
+        schema.name("Cache Output"),
+        schema.description("Cache stressor output object"),
+    ] = None
+    l1cacheinfo: typing.Annotated[
+        typing.Optional[L1CacheOutput],
+        schema.name("L1 Cache Output"),
+        schema.description("L1 Cache stressor output object"),
+    ] = None
+    preflight: typing.Annotated[
+        typing.Optional[PreflightOutput],
+        schema.name("Preflight"),
+        schema.description("Resource demand found by the preflight check"),
+    ] = None
+    energy: typing.Annotated[
+        typing.Optional[EnergyOutput],
+        schema.name("Energy"),
+        schema.description(
+            "Energy consumed and temperatures reached during the run"
+        ),
+    ] = None
+    profile: typing.Annotated[
+        typing.Optional[ProfileOutput],
+        schema.name("Profile"),
+        schema.description("Time spent in each phase of the plugin"),
+    ] = None
+    skipped: typing.Annotated[
+        typing.Optional[typing.List[str]],
+        schema.name("Skipped"),
+        schema.description(
+            "Stressors stress-ng skipped for lack of resources, such as "
+            "cyclic without CAP_SYS_NICE. Runs with skipped stressors are "
+            "neither archived nor cached."
+        ),
+    ] = None
+    cached: typing.Annotated[
+        typing.Optional[bool],
+        schema.name("Cached"),
+        schema.description(
+            "Whether the results were returned from the result cache "
+            "instead of running stress-ng"
+        ),
+    ] = False
 
 
 @dataclass
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import typing
+
+from arcaflow_plugin_sdk import plugin
+from stressng_schema import (
+    EnergyParams,
+    PreflightAction,
+    PreflightParams,
+    SystemInfoOutput,
+    WorkloadResults,
+)
+
+
+workload_results_schema = plugin.build_object_schema(WorkloadResults)
+
+
+def host_fingerprint(system_info: SystemInfoOutput) -> str:
+    """
+    Identifies the hardware a run was executed on by hashing the hostname,
+    kernel release, CPU count and total amount of RAM
+    """
+    key = "{}|{}|{}|{}".format(
+        system_info.hostname,
+        system_info.release,
+        system_info.cpus,
+        system_info.totalram,
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def jobfile_hash(jobfile: str) -> str:
+    return hashlib.sha256(jobfile.encode("utf-8")).hexdigest()
+
+
+class ResultsStore:
+    """
+    Append-only SQLite archive of workload results, indexed by host
+    fingerprint and jobfile hash so that prior runs of the same
+    configuration on the same hardware can be looked up quickly
+    """
+
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    host_fingerprint TEXT NOT NULL,
+                    jobfile_hash TEXT NOT NULL,
+                    epoch INTEGER NOT NULL,
+                    hostname TEXT NOT NULL,
+                    release TEXT NOT NULL,
+                    cpus INTEGER NOT NULL,
+                    totalram INTEGER NOT NULL,
+                    jobfile TEXT NOT NULL,
+                    results TEXT NOT NULL,
+                    workdir TEXT,
+                    run_jobfile TEXT
+                )
+                """
+            )
+            columns = [
+                row[1]
+                for row in self.connection.execute("PRAGMA table_info(runs)")
+            ]
+            # stores created before the working directory was recorded
+            if "workdir" not in columns:
+                self.connection.execute(
+                    "ALTER TABLE runs ADD COLUMN workdir TEXT"
+                )
+            # stores created before the scaled jobfile was recorded
+            if "run_jobfile" not in columns:
+                self.connection.execute(
+                    "ALTER TABLE runs ADD COLUMN run_jobfile TEXT"
+                )
+            self.connection.execute(
+                """
+                CREATE INDEX IF NOT EXISTS runs_config
+                ON runs (host_fingerprint, jobfile_hash, epoch)
+                """
+            )
+            self.connection.execute(
+                """
+                CREATE INDEX IF NOT EXISTS runs_host
+                ON runs (hostname, epoch)
+                """
+            )
+
+    def add(
+        self,
+        jobfile: str,
+        results: WorkloadResults,
+        workdir: typing.Optional[str] = None,
+        run_jobfile: typing.Optional[str] = None,
+    ) -> int:
+        """
+        Archives the results under the requested jobfile, so that runs the
+        preflight check scaled down are found by the configuration that was
+        asked for. The jobfile that was actually run is kept alongside it.
+        """
+        system_info = results.systeminfo
+        if workdir is not None:
+            workdir = os.path.realpath(workdir)
+        with self.connection:
+            cursor = self.connection.execute(
+                """
+                INSERT INTO runs (
+                    host_fingerprint, jobfile_hash, epoch, hostname,
+                    release, cpus, totalram, jobfile, results, workdir,
+                    run_jobfile
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    host_fingerprint(system_info),
+                    jobfile_hash(jobfile),
+                    system_info.epoch,
+                    system_info.hostname,
+                    system_info.release,
+                    system_info.cpus,
+                    system_info.totalram,
+                    jobfile,
+                    json.dumps(workload_results_schema.serialize(results)),
+                    workdir,
+                    run_jobfile,
+                ),
+            )
+        return cursor.lastrowid
+
+    def lookup(
+        self,
+        fingerprint: str,
+        jobfile_digest: str,
+        limit: typing.Optional[int] = None,
+        workdir: typing.Optional[str] = None,
+    ) -> typing.List[WorkloadResults]:
+        """
+        Returns the archived results for the given host fingerprint and
+        jobfile hash, newest first, optionally only those run in the given
+        working directory
+        """
+        query = """
+            SELECT results FROM runs
+            WHERE host_fingerprint = ? AND jobfile_hash = ?
+        """
+        args = [fingerprint, jobfile_digest]
+        if workdir is not None:
+            query = query + " AND workdir = ?"
+            args.append(os.path.realpath(workdir))
+        query = query + " ORDER BY epoch DESC, id DESC"
+        if limit is not None:
+            query = query + " LIMIT ?"
+            args.append(limit)
+        return [
+            workload_results_schema.unserialize(json.loads(row[0]))
+            for row in self.connection.execute(query, args)
+        ]
+
+    def close(self):
+        self.connection.close()
+
+
+def cache_key(
+    jobfile: str,
+    workdir: str,
+    stressng_version: str,
+    kernel_release: str,
+    cpu_model: str,
+    preflight: typing.Optional[PreflightParams] = None,
+    energy: typing.Optional[EnergyParams] = None,
+) -> str:
+    """
+    Identifies a run by its jobfile and working directory, as the I/O
+    stressors measure the volume the working directory is on, and by the
+    stress-ng version, kernel release and CPU model of the host. The
+    jobfile is the requested one, sizes the preflight check scales down
+    are covered by its parameters instead, and runs that sampled the
+    energy counters are kept apart from those that did not.
+    """
+    parts = [
+        jobfile,
+        os.path.realpath(workdir),
+        stressng_version,
+        kernel_release,
+        cpu_model,
+    ]
+    if preflight is not None:
+        parts.append(
+            "preflight {} {} {}".format(
+                PreflightAction(preflight.action).value,
+                preflight.memory_headroom,
+                preflight.disk_headroom,
+            )
+        )
+    if energy is not None:
+        parts.append(
+            "energy {} {}".format(
+                os.path.realpath(energy.sysfs), energy.interval
+            )
+        )
+    key = "\0".join(parts)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    SQLite backed cache of workload results, evicting entries by age and
+    by the total number of entries
+    """
+
+    def __init__(self, path: str, ttl: int, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    created REAL NOT NULL,
+                    results TEXT NOT NULL
+                )
+                """
+            )
+            self.connection.execute(
+                """
+                CREATE INDEX IF NOT EXISTS cache_created ON cache (created)
+                """
+            )
+
+    def evict(self, now: typing.Optional[float] = None):
+        if now is None:
+            now = time.time()
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM cache WHERE created < ?", (now - self.ttl,)
+            )
+            self.connection.execute(
+                """
+                DELETE FROM cache WHERE key NOT IN (
+                    SELECT key FROM cache ORDER BY created DESC LIMIT ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def get(
+        self, key: str, now: typing.Optional[float] = None
+    ) -> typing.Optional[WorkloadResults]:
+        """
+        Returns the cached results for the given key flagged as cached, or
+        None if there is no valid entry
+        """
+        self.evict(now)
+        row = self.connection.execute(
+            "SELECT results FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        results = workload_results_schema.unserialize(json.loads(row[0]))
+        return dataclasses.replace(results, cached=True)
+
+    def put(
+        self,
+        key: str,
+        results: WorkloadResults,
+        now: typing.Optional[float] = None,
+    ):
+        if now is None:
+            now = time.time()
+        with self.connection:
+            self.connection.execute(
+                """
+                INSERT OR REPLACE INTO cache (key, created, results)
+                VALUES (?, ?, ?)
+                """,
+                (
+                    key,
+                    now,
+                    json.dumps(workload_results_schema.serialize(results)),
+                ),
+            )
+        self.evict(now)
+
+    def close(self):
+        self.connection.close()
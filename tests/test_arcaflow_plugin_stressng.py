@@ -1,10 +1,80 @@
 #!/usr/bin/env python3
 
+import csv
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
 import yaml
+from unittest import mock
 import stressng_schema
 import stressng_plugin
-from arcaflow_plugin_sdk import plugin
+import stressng_store
+import stressng_export
+import stressng_metrics
+import stressng_preflight
+import stressng_energy
+import stressng_profile
+import urllib.request
+from arcaflow_plugin_sdk import plugin, schema
+
+
+def sample_system_info(**kwargs) -> stressng_schema.SystemInfoOutput:
+    system_info = {
+        "stress-ng-version": "0.15.00",
+        "run-by": "root",
+        "date-yyyy-mm-dd": "2023:01:01",
+        "time-hh-mm-ss": "12:00:00",
+        "epoch-secs": 1672574400,
+        "hostname": "testhost",
+        "sysname": "Linux",
+        "nodename": "testhost",
+        "release": "6.0.0",
+        "version": "#1 SMP",
+        "machine": "x86_64",
+        "uptime": 100,
+        "totalram": 16000000000,
+        "freeram": 8000000000,
+        "sharedram": 0,
+        "bufferram": 0,
+        "totalswap": 0,
+        "freeswap": 0,
+        "pagesize": 4096,
+        "cpus": 4,
+        "cpus-online": 4,
+        "ticks-per-second": 100,
+    }
+    system_info.update(kwargs)
+    return stressng_schema.system_info_output_schema.unserialize(system_info)
+
+
+def sample_cpu_output() -> stressng_schema.CPUOutput:
+    return stressng_schema.cpu_output_schema.unserialize(
+        {
+            "stressor": "cpu",
+            "max-rss": "4096",
+            "bogo-ops": 1000,
+            "bogo-ops-per-second-usr-sys-time": 50.0,
+            "bogo-ops-per-second-real-time": 100.0,
+            "wall-clock-time": 10.0,
+            "user-time": 19.0,
+            "system-time": 1.0,
+            "cpu-usage-per-instance": 100.0,
+        }
+    )
+
+
+def has_cap_sys_nice() -> bool:
+    # CAP_SYS_NICE is bit 23 of the effective capability set
+    try:
+        with open("/proc/self/status", "r") as status:
+            for line in status:
+                if line.startswith("CapEff:"):
+                    return bool(int(line.split()[1], 16) >> 23 & 1)
+    except EnvironmentError:
+        pass
+    return False
 
 
 class StressNGTest(unittest.TestCase):
@@ -33,6 +103,25 @@ class StressNGTest(unittest.TestCase):
             )
         )
 
+        plugin.test_object_serialization(
+            stressng_schema.HDDStressorParams(
+                stressor=stressng_schema.Stressors.HDD,
+                hdd=1,
+                hdd_bytes="1g",
+                hdd_write_size="1m",
+                hdd_opts=[
+                    stressng_schema.HddOpts.DIRECT,
+                    stressng_schema.HddOpts.WR_SEQ,
+                ],
+            )
+        )
+
+        plugin.test_object_serialization(
+            stressng_schema.AioStressorParams(
+                stressor=stressng_schema.Stressors.AIO, aio=2, aio_requests=8
+            )
+        )
+
     def test_functional_cpu(self):
         # idea is to run a small cpu bound benchmark and
         # compare its output with a known-good output
@@ -175,6 +264,1062 @@ class StressNGTest(unittest.TestCase):
         self.assertEqual(res[1].hddinfo.stressor, "hdd")
         self.assertGreaterEqual(res[1].hddinfo.wall_clock_time, 10)
 
+    def test_results_store(self):
+        jobfile = "timeout 10s\ncpu 2\ncpu-method all\n"
+        first = stressng_schema.WorkloadResults(
+            sample_system_info(), cpuinfo=sample_cpu_output()
+        )
+        second = stressng_schema.WorkloadResults(
+            sample_system_info(**{"epoch-secs": 1672574500}),
+            cpuinfo=sample_cpu_output(),
+        )
+        other_host = stressng_schema.WorkloadResults(
+            sample_system_info(cpus=8), cpuinfo=sample_cpu_output()
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "results.db")
+            store = stressng_store.ResultsStore(path)
+            store.add(jobfile, first, "/tmp")
+            store.add(jobfile, second, tmpdir)
+            store.add(jobfile, other_host)
+            store.add("timeout 20s\n", first)
+            store.close()
+
+            store = stressng_store.ResultsStore(path)
+            runs = store.lookup(
+                stressng_store.host_fingerprint(first.systeminfo),
+                stressng_store.jobfile_hash(jobfile),
+            )
+            self.assertEqual(len(runs), 2)
+            self.assertEqual(runs[0].systeminfo.epoch, 1672574500)
+            self.assertEqual(runs[1], first)
+            latest = store.lookup(
+                stressng_store.host_fingerprint(first.systeminfo),
+                stressng_store.jobfile_hash(jobfile),
+                limit=1,
+            )
+            self.assertEqual(latest, runs[:1])
+            in_tmp = store.lookup(
+                stressng_store.host_fingerprint(first.systeminfo),
+                stressng_store.jobfile_hash(jobfile),
+                workdir="/tmp",
+            )
+            self.assertEqual(in_tmp, [first])
+            store.close()
+
+    def test_results_store_scaled(self):
+        requested = "timeout 10s\nvm 2\nvm-bytes 100000g\n"
+        scaled = "timeout 10s\nvm 2\nvm-bytes 2g\n"
+        results = stressng_schema.WorkloadResults(sample_system_info())
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "results.db")
+            store = stressng_store.ResultsStore(path)
+            store.add(requested, results, tmpdir, scaled)
+            # runs scaled down by the preflight check are found by the
+            # requested jobfile, the scaled one is kept alongside
+            runs = store.lookup(
+                stressng_store.host_fingerprint(results.systeminfo),
+                stressng_store.jobfile_hash(requested),
+            )
+            self.assertEqual(runs, [results])
+            row = store.connection.execute(
+                "SELECT jobfile, run_jobfile FROM runs"
+            ).fetchone()
+            self.assertEqual(row, (requested, scaled))
+            store.close()
+
+    def test_result_cache(self):
+        results = stressng_schema.WorkloadResults(
+            sample_system_info(), cpuinfo=sample_cpu_output()
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cache.db")
+            cache = stressng_store.ResultCache(path, ttl=100, max_entries=2)
+            cache.put("a", results, now=1000)
+            cache.put("b", results, now=1010)
+            self.assertIsNone(cache.get("missing", now=1020))
+            cached = cache.get("a", now=1020)
+            self.assertTrue(cached.cached)
+            self.assertEqual(cached.cpuinfo, results.cpuinfo)
+            # the oldest entry is evicted once the cache is full
+            cache.put("c", results, now=1030)
+            self.assertIsNone(cache.get("a", now=1040))
+            self.assertIsNotNone(cache.get("b", now=1040))
+            # entries older than the TTL are evicted
+            self.assertIsNone(cache.get("b", now=1111))
+            self.assertIsNotNone(cache.get("c", now=1111))
+            cache.close()
+
+    def test_cached_run(self):
+        cpu = stressng_schema.CpuStressorParams(
+            stressor="cpu", cpu_count=2, cpu_method="all"
+        )
+        stress = stressng_schema.StressNGParams(timeout="10s", stressors=[cpu])
+        results = stressng_schema.WorkloadResults(
+            sample_system_info(), cpuinfo=sample_cpu_output()
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cache.db")
+            key = stressng_store.cache_key(
+                stress.to_jobfile() + cpu.to_jobfile(),
+                "/tmp",
+                "stress-ng, version 0.15.00",
+                os.uname().release,
+                stressng_plugin.get_cpu_model(),
+            )
+            # I/O stressors measure the volume of the working directory
+            self.assertNotEqual(
+                key,
+                stressng_store.cache_key(
+                    stress.to_jobfile() + cpu.to_jobfile(),
+                    tmpdir,
+                    "stress-ng, version 0.15.00",
+                    os.uname().release,
+                    stressng_plugin.get_cpu_model(),
+                ),
+            )
+            cache = stressng_store.ResultCache(path, ttl=100, max_entries=10)
+            cache.put(key, results)
+            cache.close()
+
+            export = os.path.join(tmpdir, "export")
+            workload_params = stressng_schema.WorkloadParams(
+                stress,
+                cache=stressng_schema.CacheParams(path=path),
+                export=stressng_schema.ExportParams(
+                    path=export, format=stressng_schema.ExportFormat.CSV
+                ),
+                results_store=os.path.join(tmpdir, "results.db"),
+            )
+            with mock.patch.object(
+                stressng_plugin,
+                "get_stressng_version",
+                return_value="stress-ng, version 0.15.00",
+            ):
+                res = stressng_plugin.stressng_run(workload_params)
+            self.assertEqual(res[0], "success")
+            self.assertTrue(res[1].cached)
+            self.assertEqual(res[1].cpuinfo, results.cpuinfo)
+            # cached results are exported like fresh ones but not archived
+            # again
+            self.assertEqual(len(os.listdir(export)), 2)
+            self.assertFalse(os.path.exists(workload_params.results_store))
+
+    def test_cached_run_energy(self):
+        cpu = stressng_schema.CpuStressorParams(
+            stressor="cpu", cpu_count=2, cpu_method="all"
+        )
+        stress = stressng_schema.StressNGParams(timeout="10s", stressors=[cpu])
+        results = stressng_schema.WorkloadResults(
+            sample_system_info(), cpuinfo=sample_cpu_output()
+        )
+        energy = stressng_schema.EnergyParams()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cache.db")
+            key = stressng_store.cache_key(
+                stress.to_jobfile() + cpu.to_jobfile(),
+                "/tmp",
+                "stress-ng, version 0.15.00",
+                os.uname().release,
+                stressng_plugin.get_cpu_model(),
+            )
+            self.assertNotEqual(
+                key,
+                stressng_store.cache_key(
+                    stress.to_jobfile() + cpu.to_jobfile(),
+                    "/tmp",
+                    "stress-ng, version 0.15.00",
+                    os.uname().release,
+                    stressng_plugin.get_cpu_model(),
+                    energy=energy,
+                ),
+            )
+            # results cached without energy data
+            cache = stressng_store.ResultCache(path, ttl=100, max_entries=10)
+            cache.put(key, results)
+            cache.close()
+
+            workload_params = stressng_schema.WorkloadParams(
+                stress,
+                cache=stressng_schema.CacheParams(path=path),
+                energy=energy,
+            )
+            # the python interpreter rejects the stress-ng arguments, so
+            # only a cache hit could succeed
+            with mock.patch.object(
+                stressng_plugin,
+                "get_stressng_version",
+                return_value="stress-ng, version 0.15.00",
+            ), mock.patch.object(
+                stressng_plugin, "stressng_binary", sys.executable
+            ):
+                res = stressng_plugin.stressng_run(workload_params)
+            self.assertEqual(res[0], "error")
+
+    def test_export_csv(self):
+        results = stressng_schema.WorkloadResults(
+            sample_system_info(), cpuinfo=sample_cpu_output()
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            written = stressng_export.export_results(
+                results, tmpdir, stressng_schema.ExportFormat.CSV
+            )
+            self.assertEqual(
+                [os.path.basename(path) for path in written],
+                [
+                    "systeminfo-testhost-1672574400.csv",
+                    "metrics-testhost-1672574400.csv",
+                ],
+            )
+            with open(written[1], newline="") as file:
+                rows = list(csv.DictReader(file))
+            self.assertEqual(len(rows), 1)
+            self.assertEqual(rows[0]["stressor"], "cpu")
+            self.assertEqual(rows[0]["hostname"], "testhost")
+            self.assertEqual(
+                float(rows[0]["bogo_ops_per_second_real_time"]), 100
+            )
+
+    @unittest.skipIf(stressng_export.pyarrow is None, "pyarrow not installed")
+    def test_export_parquet(self):
+        results = stressng_schema.WorkloadResults(
+            sample_system_info(), cpuinfo=sample_cpu_output()
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            written = stressng_export.export_results(
+                results, tmpdir, stressng_schema.ExportFormat.PARQUET
+            )
+            table = stressng_export.pyarrow.parquet.read_table(written[1])
+            self.assertEqual(table.column("bogo_ops").to_pylist(), [1000])
+            self.assertEqual(
+                table.schema.field("wall_clock_time").type,
+                stressng_export.pyarrow.float64(),
+            )
+
+    def test_metrics_exporter(self):
+        jobfile = "timeout 10s\ncpu 2\ncpu-method all\nvm 1\nvm-bytes 1g\n"
+        results = stressng_schema.WorkloadResults(
+            sample_system_info(), cpuinfo=sample_cpu_output()
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            textfile = os.path.join(tmpdir, "stressng.prom")
+            exporter = stressng_metrics.MetricsExporter(textfile, port=0)
+            exporter.start()
+            try:
+                exporter.update_run(jobfile, 1.5, True)
+                with urllib.request.urlopen(
+                    "http://127.0.0.1:{}/metrics".format(exporter.port)
+                ) as response:
+                    scraped = response.read().decode("utf-8")
+            finally:
+                exporter.stop()
+            self.assertIn("stressng_running 1\n", scraped)
+            self.assertIn("stressng_elapsed_seconds 1.5\n", scraped)
+            self.assertIn(
+                'stressng_stressor_workers{stressor="cpu"} 2\n', scraped
+            )
+            self.assertIn(
+                'stressng_stressor_workers{stressor="vm"} 1\n', scraped
+            )
+            self.assertTrue(scraped.endswith("# EOF\n"))
+
+            exporter.update_run(jobfile, 10.2, False)
+            exporter.update_results(results)
+            with open(textfile, "r") as file:
+                exposed = file.read()
+            self.assertIn("stressng_running 0\n", exposed)
+            self.assertIn('stressng_bogo_ops{stressor="cpu"} 1000\n', exposed)
+
+    def test_metrics_failed_run(self):
+        cpu = stressng_schema.CpuStressorParams(stressor="cpu", cpu_count=1)
+        stress = stressng_schema.StressNGParams(timeout="1s", stressors=[cpu])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            textfile = os.path.join(tmpdir, "stressng.prom")
+            workload_params = stressng_schema.WorkloadParams(
+                stress,
+                metrics=stressng_schema.MetricsParams(textfile=textfile),
+            )
+            # the python interpreter rejects the stress-ng arguments
+            with mock.patch.object(
+                stressng_plugin, "stressng_binary", sys.executable
+            ):
+                res = stressng_plugin.stressng_run(workload_params)
+            self.assertEqual(res[0], "error")
+            with open(textfile, "r") as file:
+                self.assertIn("stressng_running 0\n", file.read())
+
+    def test_metrics_textfile_checked(self):
+        cpu = stressng_schema.CpuStressorParams(stressor="cpu", cpu_count=1)
+        stress = stressng_schema.StressNGParams(timeout="1s", stressors=[cpu])
+        workload_params = stressng_schema.WorkloadParams(
+            stress,
+            metrics=stressng_schema.MetricsParams(
+                textfile="/nonexistent/dir/stressng.prom"
+            ),
+        )
+        with mock.patch.object(stressng_plugin, "run_stressng") as run:
+            res = stressng_plugin.stressng_run(workload_params)
+        self.assertEqual(res[0], "error")
+        self.assertIn("metrics exporter", res[1].error)
+        run.assert_not_called()
+
+        workload_schema = plugin.build_object_schema(
+            stressng_schema.WorkloadParams
+        )
+        for option in ("metrics", "energy"):
+            with self.assertRaises(schema.ConstraintException):
+                workload_schema.unserialize(
+                    {
+                        "StressNGParams": {
+                            "timeout": "1s",
+                            "stressors": [{"stressor": "cpu", "cpu_count": 1}],
+                        },
+                        option: {"interval": 0},
+                    }
+                )
+
+    def test_run_stressng_ticks(self):
+        ticks = []
+        output = stressng_plugin.run_stressng(
+            [
+                sys.executable,
+                "-c",
+                "import time; time.sleep(0.5); print('ok')",
+            ],
+            ".",
+            lambda: ticks.append(True),
+            0.1,
+        )
+        self.assertEqual(output, "ok\n")
+        self.assertGreater(len(ticks), 0)
+
+    def test_run_stressng_skipped(self):
+        # stress-ng exits with 3 when stressors lack resources
+        skipped = [sys.executable, "-c", "print('skipped'); exit(3)"]
+        output = stressng_plugin.run_stressng(skipped, ".", allow_skipped=True)
+        self.assertEqual(output, "skipped\n")
+        for command in (skipped, [sys.executable, "-c", "exit(2)"]):
+            with self.assertRaises(subprocess.CalledProcessError):
+                stressng_plugin.run_stressng(command, ".")
+
+        stressors = [
+            stressng_schema.CpuStressorParams(stressor="cpu", cpu_count=1),
+            stressng_schema.CyclicStressorParams(stressor="cyclic", cyclic=1),
+        ]
+        cpu_metrics = [{"stressor": "cpu"}]
+        summary = "stress-ng: info:  [42] skipped: {}\n"
+        self.assertEqual(
+            stressng_plugin.find_skipped(
+                stressors, cpu_metrics, summary.format("1: cyclic (1)")
+            ),
+            ["cyclic"],
+        )
+        self.assertEqual(
+            stressng_plugin.find_skipped(stressors, cpu_metrics, ""),
+            ["cyclic"],
+        )
+        self.assertEqual(
+            stressng_plugin.find_skipped(
+                stressors,
+                cpu_metrics + [{"stressor": "cyclic"}],
+                summary.format("0"),
+            ),
+            [],
+        )
+        for metrics, output in (
+            # a stressor that ran out of resources is not a skippable one
+            (cpu_metrics, summary.format("2: cpu (1) cyclic (1)")),
+            ([{"stressor": "cyclic"}], ""),
+            (
+                cpu_metrics,
+                "stress-ng: info:  [42] failed: 1: cpu (1)\n",
+            ),
+        ):
+            with self.assertRaises(ValueError):
+                stressng_plugin.find_skipped(stressors, metrics, output)
+
+    def test_hdd_opts(self):
+        hdd = stressng_schema.HDDStressorParams(
+            stressor="hdd",
+            hdd=1,
+            hdd_bytes="100m",
+            hdd_write_size="4m",
+            hdd_opts=["direct", "wr-seq", "rd-rnd"],
+        )
+        stress = stressng_schema.StressNGParams(timeout="10s", stressors=[hdd])
+        with open("tests/reference_jobfile_hdd_opts", "r") as file:
+            reference = yaml.safe_load(file)
+        self.assertEqual(
+            yaml.safe_load(stress.to_jobfile() + hdd.to_jobfile()), reference
+        )
+
+        hdd.hdd_opts = ["fadv-seq", "fadv-willneed", "fadv-noreuse"]
+        self.assertIn(
+            "hdd-opts fadv-seq,fadv-willneed,fadv-noreuse\n", hdd.to_jobfile()
+        )
+        for conflict in (
+            ["fadv-normal", "fadv-willneed"],
+            ["fadv-willneed", "fadv-dontneed"],
+        ):
+            hdd.hdd_opts = conflict
+            with self.assertRaises(ValueError):
+                hdd.to_jobfile()
+        hdd.hdd_opts = ["wr-seq", "wr-rnd"]
+        with self.assertRaises(ValueError):
+            hdd.to_jobfile()
+        res = stressng_plugin.stressng_run(
+            stressng_schema.WorkloadParams(stress)
+        )
+        self.assertEqual(res[0], "error")
+
+    def test_param_limits(self):
+        workload_schema = plugin.build_object_schema(
+            stressng_schema.WorkloadParams
+        )
+        for stressor in (
+            {"stressor": "mq", "mq": 1, "mq_size": 33},
+            {"stressor": "matrix", "matrix": 1, "matrix_size": 0},
+            {"stressor": "aio", "aio": 1, "aio_requests": 8192},
+            {"stressor": "cyclic", "cyclic": 1, "cyclic_prio": 101},
+            {"stressor": "stream", "stream": 1, "stream_madvise": "random"},
+        ):
+            with self.assertRaises(schema.ConstraintException):
+                workload_schema.unserialize(
+                    {
+                        "StressNGParams": {
+                            "timeout": "1s",
+                            "stressors": [stressor],
+                        }
+                    }
+                )
+        for preflight in (
+            {"memory_headroom": -1},
+            {"memory_headroom": 100},
+            {"disk_headroom": 100},
+        ):
+            with self.assertRaises(schema.ConstraintException):
+                workload_schema.unserialize(
+                    {
+                        "StressNGParams": {
+                            "timeout": "1s",
+                            "stressors": [{"stressor": "cpu", "cpu_count": 1}],
+                        },
+                        "preflight": preflight,
+                    }
+                )
+
+    def test_misc_metrics(self):
+        output = (
+            "stress-ng: metrc: [42] stressor       bogo ops real time\n"
+            "stress-ng: metrc: [42] hdd               1234     10.00\n"
+            "stress-ng: metrc: [42] miscellaneous metrics:\n"
+            "stress-ng: metrc: [42] hdd                1234.56 MB/sec read "
+            "rate (harmonic mean of 1 instance)\n"
+            "stress-ng: metrc: [42] hdd                 567.89 MB/sec write "
+            "rate (harmonic mean of 1 instance)\n"
+            "stress-ng: metrc: [42] hdd                 700.00 MB/sec "
+            "read/write combined rate (harmonic mean of 1 instance)\n"
+            "stress-ng: info:  [42] successful run completed in 10.00s\n"
+        )
+        misc = stressng_plugin.parse_misc_metrics(output)
+        self.assertEqual(list(misc), ["hdd"])
+        self.assertEqual(len(misc["hdd"]), 3)
+        self.assertEqual(misc["hdd"][0].description, "MB/sec read rate")
+        self.assertEqual(
+            stressng_plugin.misc_metric(
+                misc["hdd"], ("mb", "read"), ("write",)
+            ),
+            1234.56,
+        )
+        self.assertEqual(
+            stressng_plugin.misc_metric(
+                misc["hdd"], ("mb", "write"), ("read",)
+            ),
+            567.89,
+        )
+
+        # newer stress-ng versions add the metrics to the YAML output
+        metric = stressng_schema.hdd_output_schema.serialize(
+            stressng_schema.HDDOutput(**vars(sample_cpu_output()))
+        )
+        metric["mb-sec-read-rate"] = 100.0
+        hdd = stressng_plugin.unserialize_metric(
+            stressng_schema.hdd_output_schema, metric, []
+        )
+        self.assertEqual(hdd.misc_metrics[0].description, "mb-sec-read-rate")
+        self.assertEqual(
+            stressng_plugin.misc_metric(hdd.misc_metrics, ("mb", "read")), 100
+        )
+
+    def test_functional_io(self):
+        stressors = [
+            stressng_schema.IomixStressorParams(
+                stressor="iomix", iomix=1, iomix_bytes="100m"
+            ),
+            stressng_schema.AioStressorParams(
+                stressor="aio", aio=1, aio_requests=32
+            ),
+            stressng_schema.AiolStressorParams(
+                stressor="aiol", aiol=1, aiol_requests=32
+            ),
+            stressng_schema.ReadaheadStressorParams(
+                stressor="readahead", readahead=1, readahead_bytes="100m"
+            ),
+        ]
+
+        stress = stressng_schema.StressNGParams(
+            timeout="10s", stressors=stressors
+        )
+
+        reference_jobfile = "tests/reference_jobfile_io"
+
+        result = stress.to_jobfile()
+
+        for item in stress.stressors:
+            result = result + item.to_jobfile()
+
+        with open(reference_jobfile, "r") as file:
+            try:
+                reference = yaml.safe_load(file)
+            except yaml.YAMLError as e:
+                print(e)
+
+        self.assertEqual(yaml.safe_load(result), reference)
+        workload_params = stressng_schema.WorkloadParams(stress, True)
+        res = stressng_plugin.stressng_run(workload_params)
+        self.assertIn("success", res)
+        self.assertEqual(res[1].iomixinfo.stressor, "iomix")
+        self.assertEqual(res[1].aioinfo.stressor, "aio")
+        self.assertEqual(res[1].aiolinfo.stressor, "aiol")
+        self.assertEqual(res[1].readaheadinfo.stressor, "readahead")
+        self.assertGreaterEqual(res[1].iomixinfo.wall_clock_time, 10)
+
+    def test_memory_results(self):
+        output = (
+            "stress-ng: info:  [42] cache:\n"
+            "stress-ng: info:  [42]       1,234,567,890 CPU Cycles"
+            "                 1.23 B/sec\n"
+            "stress-ng: info:  [42]          40,000,000 Cache References"
+            "          4.00 M/sec\n"
+            "stress-ng: info:  [42]          10,000,000 Cache Misses"
+            "              1.00 M/sec\n"
+            "stress-ng: metrc: [42] miscellaneous metrics:\n"
+            "stress-ng: metrc: [42] stream      9000.00 MB per sec memory "
+            "read rate (harmonic mean of 1 instance)\n"
+            "stress-ng: metrc: [42] stream      6000.00 MB per sec memory "
+            "write rate (harmonic mean of 1 instance)\n"
+            "stress-ng: metrc: [42] stream       800.00 Mflop per sec "
+            "(double precision) compute rate (harmonic mean of 1 instance)\n"
+        )
+        perf = stressng_plugin.parse_perf_counters(output)
+        self.assertEqual(perf["cache"]["cache-misses"], 10000000)
+        self.assertEqual(perf["cache"]["cpu-cycles"], 1234567890)
+        self.assertEqual(
+            stressng_plugin.parse_perf_counters(
+                "", [{"stressor": "cache", "cache-misses": 5}]
+            ),
+            {"cache": {"cache-misses": 5}},
+        )
+
+        common = vars(sample_cpu_output())
+        misc = stressng_plugin.parse_misc_metrics(output)
+        outputs = {
+            "streaminfo": stressng_schema.StreamOutput(
+                **dict(common, stressor="stream", misc_metrics=misc["stream"])
+            ),
+            "cacheinfo": stressng_schema.CacheOutput(
+                **dict(common, stressor="cache")
+            ),
+        }
+        stressng_plugin.derive_results(outputs, perf, [], sample_system_info())
+        self.assertEqual(outputs["streaminfo"].read_rate, 9000)
+        self.assertEqual(outputs["streaminfo"].write_rate, 6000)
+        self.assertEqual(outputs["streaminfo"].mflops, 800)
+        self.assertEqual(outputs["cacheinfo"].cache_references, 40000000)
+        self.assertEqual(outputs["cacheinfo"].cache_miss_ratio, 0.25)
+
+    def test_functional_memory(self):
+        stressors = [
+            stressng_schema.VmStressorParams(
+                stressor="vm",
+                vm=1,
+                vm_bytes="100m",
+                vm_method="flip",
+                vm_keep=True,
+                vm_populate=True,
+                vm_madvise="hugepage",
+            ),
+            stressng_schema.StreamStressorParams(
+                stressor="stream",
+                stream=1,
+                stream_index=1,
+                stream_madvise="nohugepage",
+            ),
+            stressng_schema.MemcpyStressorParams(
+                stressor="memcpy", memcpy=1, memcpy_method="libc"
+            ),
+            stressng_schema.CacheStressorParams(
+                stressor="cache", cache=1, cache_level=2
+            ),
+            stressng_schema.L1CacheStressorParams(
+                stressor="l1cache", l1cache=1, l1cache_ways=8
+            ),
+        ]
+
+        stress = stressng_schema.StressNGParams(
+            timeout="10s", stressors=stressors, taskset="0"
+        )
+
+        reference_jobfile = "tests/reference_jobfile_memory"
+
+        result = stress.to_jobfile()
+
+        for item in stress.stressors:
+            result = result + item.to_jobfile()
+
+        with open(reference_jobfile, "r") as file:
+            reference = file.read().splitlines()
+
+        self.assertEqual(result.splitlines(), reference)
+        workload_params = stressng_schema.WorkloadParams(stress, True)
+        res = stressng_plugin.stressng_run(workload_params)
+        self.assertIn("success", res)
+        self.assertEqual(res[1].vminfo.stressor, "vm")
+        self.assertEqual(res[1].streaminfo.stressor, "stream")
+        self.assertEqual(res[1].memcpyinfo.stressor, "memcpy")
+        self.assertEqual(res[1].cacheinfo.stressor, "cache")
+        self.assertEqual(res[1].l1cacheinfo.stressor, "l1cache")
+        self.assertGreaterEqual(res[1].streaminfo.wall_clock_time, 10)
+
+    def test_matrix_results(self):
+        common = vars(sample_cpu_output())
+        outputs = {
+            "matrixinfo": stressng_schema.MatrixOutput(
+                **dict(common, stressor="matrix")
+            ),
+            "matrix3dinfo": stressng_schema.Matrix3dOutput(
+                **dict(common, stressor="matrix-3d")
+            ),
+        }
+        stressors = [
+            stressng_schema.MatrixStressorParams(
+                stressor="matrix", matrix=2, matrix_size=128
+            ),
+            stressng_schema.Matrix3dStressorParams(
+                stressor="matrix-3d", matrix_3d=0
+            ),
+        ]
+        stressng_plugin.derive_results(
+            outputs, {}, stressors, sample_system_info()
+        )
+        self.assertEqual(outputs["matrixinfo"].workers, 2)
+        self.assertEqual(outputs["matrixinfo"].ops_per_second_per_worker, 50)
+        self.assertEqual(
+            outputs["matrixinfo"].element_ops_per_second_per_worker,
+            50 * 128 * 128,
+        )
+        # 0 workers means one per online CPU and the size is unknown
+        self.assertEqual(outputs["matrix3dinfo"].workers, 4)
+        self.assertEqual(outputs["matrix3dinfo"].ops_per_second_per_worker, 25)
+        self.assertIsNone(
+            outputs["matrix3dinfo"].element_ops_per_second_per_worker
+        )
+
+    def test_functional_matrix_methods(self):
+        stressors = [
+            stressng_schema.MatrixStressorParams(
+                stressor="matrix",
+                matrix=2,
+                matrix_method="prod",
+                matrix_size=128,
+                matrix_yx=True,
+            ),
+            stressng_schema.Matrix3dStressorParams(
+                stressor="matrix-3d",
+                matrix_3d=1,
+                matrix_3d_method="add",
+                matrix_3d_size=32,
+                matrix_3d_zyx=True,
+            ),
+        ]
+
+        stress = stressng_schema.StressNGParams(
+            timeout="10s", stressors=stressors
+        )
+
+        reference_jobfile = "tests/reference_jobfile_matrix_methods"
+
+        result = stress.to_jobfile()
+
+        for item in stress.stressors:
+            result = result + item.to_jobfile()
+
+        with open(reference_jobfile, "r") as file:
+            reference = file.read().splitlines()
+
+        self.assertEqual(result.splitlines(), reference)
+        workload_params = stressng_schema.WorkloadParams(stress, True)
+        res = stressng_plugin.stressng_run(workload_params)
+        self.assertIn("success", res)
+        self.assertEqual(res[1].matrixinfo.stressor, "matrix")
+        self.assertEqual(res[1].matrix3dinfo.stressor, "matrix-3d")
+        self.assertEqual(res[1].matrixinfo.workers, 2)
+        self.assertGreater(
+            res[1].matrixinfo.element_ops_per_second_per_worker, 0
+        )
+
+    def test_ipc_results(self):
+        output = (
+            "stress-ng: metrc: [42] miscellaneous metrics:\n"
+            "stress-ng: metrc: [42] futex        1500.00 nanosecs per "
+            "futex_wait call (geometric mean of 2 instances)\n"
+            "stress-ng: metrc: [42] pipe          250.00 MB per sec data "
+            "pipe write (geometric mean of 1 instances)\n"
+        )
+        misc = stressng_plugin.parse_misc_metrics(output)
+        common = vars(sample_cpu_output())
+        outputs = {
+            "futexinfo": stressng_schema.FutexOutput(
+                **dict(common, stressor="futex", misc_metrics=misc["futex"])
+            ),
+            "pipeinfo": stressng_schema.PipeOutput(
+                **dict(common, stressor="pipe", misc_metrics=misc["pipe"])
+            ),
+        }
+        stressors = [
+            stressng_schema.FutexStressorParams(stressor="futex", futex=2),
+            stressng_schema.PipeStressorParams(stressor="pipe", pipe=0),
+        ]
+        stressng_plugin.derive_results(
+            outputs, {}, stressors, sample_system_info()
+        )
+        # 2 workers at 100 bogo-ops per second in total
+        self.assertEqual(outputs["futexinfo"].workers, 2)
+        self.assertEqual(outputs["futexinfo"].mean_op_latency, 2e7)
+        self.assertEqual(outputs["futexinfo"].reported_latency, 1500)
+        self.assertIsNone(outputs["futexinfo"].throughput)
+        self.assertEqual(outputs["pipeinfo"].workers, 4)
+        self.assertEqual(outputs["pipeinfo"].throughput, 250)
+        self.assertIsNone(outputs["pipeinfo"].reported_latency)
+
+    def test_functional_ipc(self):
+        stressors = [
+            stressng_schema.MqStressorParams(stressor="mq", mq=1, mq_size=16),
+            stressng_schema.PipeStressorParams(
+                stressor="pipe",
+                pipe=1,
+                pipe_data_size="4k",
+                pipe_size="64k",
+            ),
+            stressng_schema.SemStressorParams(
+                stressor="sem", sem=1, sem_procs=4
+            ),
+            stressng_schema.FutexStressorParams(stressor="futex", futex=1),
+            stressng_schema.MsgStressorParams(
+                stressor="msg", msg=1, msg_types=10
+            ),
+            stressng_schema.SockStressorParams(
+                stressor="sock",
+                sock=1,
+                sock_domain="unix",
+                sock_type="stream",
+                sock_nodelay=True,
+            ),
+        ]
+
+        stress = stressng_schema.StressNGParams(
+            timeout="10s", stressors=stressors
+        )
+
+        reference_jobfile = "tests/reference_jobfile_ipc"
+
+        result = stress.to_jobfile()
+
+        for item in stress.stressors:
+            result = result + item.to_jobfile()
+
+        with open(reference_jobfile, "r") as file:
+            reference = file.read().splitlines()
+
+        self.assertEqual(result.splitlines(), reference)
+        workload_params = stressng_schema.WorkloadParams(stress, True)
+        res = stressng_plugin.stressng_run(workload_params)
+        self.assertIn("success", res)
+        for name in ["mq", "pipe", "sem", "futex", "msg", "sock"]:
+            output = getattr(res[1], name + "info")
+            self.assertEqual(output.stressor, name)
+            self.assertEqual(output.workers, 1)
+            self.assertGreater(output.mean_op_latency, 0)
+
+    def test_cyclic_latency(self):
+        prefix = "stress-ng: info:  [42] cyclic: "
+        output = "\n".join(
+            prefix + line
+            for line in [
+                "sched SCHED_FIFO: 20000 ns delay, 5000 samples",
+                "  mean: 1234.56 ns, mode: 1100 ns",
+                "  min: 1000 ns, max: 50000 ns, std.dev. 345.67",
+                "latency percentiles:",
+                "   25.00%:       1100 ns",
+                "   50.00%:       1200 ns",
+                "   99.90%:       5000 ns",
+                "latency distribution (1000 ns intervals):",
+                "(for the first 3 buckets of 3)",
+                "latency (ns) frequency",
+                "         0          0",
+                "      1000       4900",
+                "      2000        100",
+            ]
+        )
+        latency = stressng_plugin.parse_cyclic_latency(output)
+        self.assertEqual(latency["latency_mean"], 1234.56)
+        self.assertEqual(latency["latency_min"], 1000)
+        self.assertEqual(latency["latency_max"], 50000)
+        self.assertEqual(latency["latency_stddev"], 345.67)
+        self.assertEqual(
+            latency["latency_percentiles"][1],
+            stressng_schema.LatencyPercentileOutput(50, 1200),
+        )
+        self.assertEqual(len(latency["latency_percentiles"]), 3)
+        self.assertEqual(
+            latency["latency_histogram"],
+            [
+                stressng_schema.LatencyBucketOutput(0, 0),
+                stressng_schema.LatencyBucketOutput(1000, 4900),
+                stressng_schema.LatencyBucketOutput(2000, 100),
+            ],
+        )
+        self.assertEqual(stressng_plugin.parse_cyclic_latency(""), {})
+
+    def test_functional_cyclic(self):
+        # the cyclic stressor measures the latency induced by the cpu load
+        stressors = [
+            stressng_schema.CpuStressorParams(
+                stressor="cpu", cpu_count=2, cpu_method=None
+            ),
+            stressng_schema.CyclicStressorParams(
+                stressor="cyclic",
+                cyclic=1,
+                cyclic_policy="fifo",
+                cyclic_prio=90,
+                cyclic_sleep=20000,
+                cyclic_method="clock_ns",
+                cyclic_dist=1000,
+                cyclic_samples=5000,
+            ),
+        ]
+
+        stress = stressng_schema.StressNGParams(
+            timeout="10s", stressors=stressors
+        )
+
+        reference_jobfile = "tests/reference_jobfile_cyclic"
+
+        result = stress.to_jobfile()
+
+        for item in stress.stressors:
+            result = result + item.to_jobfile()
+
+        with open(reference_jobfile, "r") as file:
+            try:
+                reference = yaml.safe_load(file)
+            except yaml.YAMLError as e:
+                print(e)
+
+        self.assertEqual(yaml.safe_load(result), reference)
+        if not has_cap_sys_nice():
+            self.skipTest("the cyclic stressor needs CAP_SYS_NICE")
+        workload_params = stressng_schema.WorkloadParams(stress, True)
+        res = stressng_plugin.stressng_run(workload_params)
+        self.assertIn("success", res)
+        self.assertEqual(res[1].cpuinfo.stressor, "cpu")
+        self.assertEqual(res[1].cyclicinfo.stressor, "cyclic")
+
+    def test_parse_size(self):
+        self.assertEqual(stressng_preflight.parse_size("512", 0), 512)
+        self.assertEqual(stressng_preflight.parse_size("4k", 0), 4096)
+        self.assertEqual(stressng_preflight.parse_size("20G", 0), 20 * 2**30)
+        self.assertEqual(stressng_preflight.parse_size("1.5m", 0), 1572864)
+        self.assertEqual(stressng_preflight.parse_size("25%", 1000), 250)
+        with self.assertRaises(ValueError):
+            stressng_preflight.parse_size("lots", 0)
+
+    def test_preflight(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            meminfo = os.path.join(tmpdir, "meminfo")
+            with open(meminfo, "w") as file:
+                file.write("MemTotal: 4194304 kB\nMemAvailable: 1048576 kB\n")
+
+            def stressors():
+                return [
+                    stressng_schema.VmStressorParams(
+                        stressor="vm", vm=2, vm_bytes="1g"
+                    ),
+                    stressng_schema.HDDStressorParams(
+                        stressor="hdd",
+                        hdd=1,
+                        hdd_bytes="10m",
+                        hdd_write_size="1m",
+                    ),
+                ]
+
+            fail = stressng_schema.PreflightParams()
+            with self.assertRaises(ValueError):
+                stressng_preflight.preflight(
+                    stressors(), tmpdir, fail, meminfo
+                )
+
+            fits = stressng_schema.PreflightParams(memory_headroom=0)
+            small = stressors()
+            small[0].vm_bytes = "50%"
+            output = stressng_preflight.preflight(small, tmpdir, fits, meminfo)
+            self.assertEqual(output.memory_demand, 2**29)
+            self.assertEqual(output.memory_available, 2**30)
+            self.assertEqual(output.disk_demand, 10 * 2**20)
+            self.assertIsNone(output.memory_scale)
+
+            scale = stressng_schema.PreflightParams(
+                action=stressng_schema.PreflightAction.SCALE
+            )
+            scaled = stressors()
+            output = stressng_preflight.preflight(
+                scaled, tmpdir, scale, meminfo
+            )
+            self.assertAlmostEqual(output.memory_scale, 0.45, places=3)
+            self.assertIsNone(output.disk_scale)
+            self.assertEqual(scaled[1].hdd_bytes, "10m")
+            vm_bytes = stressng_preflight.parse_size(scaled[0].vm_bytes, 0)
+            self.assertLessEqual(2 * vm_bytes, 0.9 * 2**30)
+            self.assertGreater(2 * vm_bytes, 0.89 * 2**30)
+
+    def test_energy(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = {
+                "class/powercap/intel-rapl:0/name": "package-0",
+                "class/powercap/intel-rapl:0/max_energy_range_uj": "1000000",
+                "class/powercap/intel-rapl:0/energy_uj": "900000",
+                "class/powercap/intel-rapl:0:0/name": "core",
+                "class/powercap/intel-rapl:0:0/energy_uj": "0",
+                "class/powercap/intel-rapl:0:1/name": "dram",
+                "class/powercap/intel-rapl:0:1/energy_uj": "1000",
+                "class/hwmon/hwmon0/temp1_input": "50000",
+                "class/thermal/thermal_zone0/temp": "60000",
+            }
+
+            def write(name, value):
+                path = os.path.join(tmpdir, name)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w") as file:
+                    file.write(value + "\n")
+
+            for name, value in files.items():
+                write(name, value)
+
+            monitor = stressng_energy.EnergyMonitor(tmpdir)
+            monitor.start()
+            # the package counter wraps around between the samples
+            write("class/powercap/intel-rapl:0/energy_uj", "100000")
+            write("class/powercap/intel-rapl:0:1/energy_uj", "51000")
+            write("class/hwmon/hwmon0/temp1_input", "70000")
+            energy = monitor.stop()
+            self.assertAlmostEqual(energy.package_energy, 0.2)
+            self.assertAlmostEqual(energy.dram_energy, 0.05)
+            self.assertEqual(energy.max_temperature, 70.0)
+            self.assertEqual(energy.average_temperature, 60.0)
+
+            energy.package_energy = 200.0
+            energy.dram_energy = 50.0
+            cpuinfo = sample_cpu_output()
+            stressng_energy.attribute_energy([cpuinfo], energy)
+            self.assertEqual(cpuinfo.energy, 250.0)
+            self.assertEqual(cpuinfo.average_power, 25.0)
+            self.assertEqual(cpuinfo.bogo_ops_per_joule, 4.0)
+
+            missing = stressng_energy.EnergyMonitor(
+                os.path.join(tmpdir, "missing")
+            )
+            missing.start()
+            energy = missing.stop()
+            self.assertIsNone(energy.package_energy)
+            self.assertIsNone(energy.dram_energy)
+            self.assertIsNone(energy.package_power)
+            self.assertIsNone(energy.max_temperature)
+            stressng_energy.attribute_energy([cpuinfo], energy)
+            self.assertEqual(cpuinfo.energy, 250.0)
+
+    def test_profiler(self):
+        disabled = stressng_profile.Profiler()
+        disabled.start()
+        with disabled.span("jobfile"):
+            pass
+        self.assertIsNone(disabled.output())
+
+        profiler = stressng_profile.Profiler(
+            stressng_schema.ProfileParams(
+                cprofile=True, tracemalloc=True, limit=5
+            )
+        )
+        profiler.start()
+        try:
+            with profiler.span("jobfile"):
+                "".join(str(i) for i in range(1000))
+            stressng_plugin.run_stressng(
+                [sys.executable, "-c", "import time; time.sleep(0.2)"],
+                ".",
+                profiler=profiler,
+            )
+            with profiler.span("jobfile"):
+                pass
+            output = profiler.output()
+        finally:
+            profiler.stop()
+
+        phases = {phase.phase: phase.duration for phase in output.phases}
+        self.assertEqual(list(phases), ["jobfile", "spawn", "runtime"])
+        self.assertGreaterEqual(phases["runtime"], 0.2)
+        self.assertAlmostEqual(
+            output.overhead, output.total - phases["runtime"]
+        )
+        self.assertIn("cumulative", output.cprofile_stats)
+        self.assertGreater(output.peak_memory, 0)
+        self.assertIsNotNone(output.tracemalloc_stats)
+
+    def test_preflight_keeps_params(self):
+        vm = stressng_schema.VmStressorParams(
+            stressor="vm", vm=2, vm_bytes="100000g"
+        )
+        stress = stressng_schema.StressNGParams(timeout="1s", stressors=[vm])
+        scale = stressng_schema.PreflightParams(
+            action=stressng_schema.PreflightAction.SCALE
+        )
+        workload_params = stressng_schema.WorkloadParams(
+            stress, preflight=scale
+        )
+        # the python interpreter rejects the stress-ng arguments
+        with mock.patch.object(
+            stressng_plugin, "stressng_binary", sys.executable
+        ):
+            res = stressng_plugin.stressng_run(workload_params)
+        self.assertEqual(res[0], "error")
+        # the sizes are only scaled in the jobfile that gets run, so the
+        # cache key of the requested jobfile stays the same
+        self.assertEqual(vm.vm_bytes, "100000g")
+        key = stressng_store.cache_key(
+            stress.to_jobfile() + vm.to_jobfile(), "/tmp", "0.15", "6.0", "x"
+        )
+        self.assertNotEqual(
+            key,
+            stressng_store.cache_key(
+                stress.to_jobfile() + vm.to_jobfile(),
+                "/tmp",
+                "0.15",
+                "6.0",
+                "x",
+                scale,
+            ),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()